@@ -1,15 +1,458 @@
 """
-AI-powered resume analyzer using LangChain and OpenAI.
+AI-powered resume analyzer using the OpenAI API.
 """
 
+import asyncio
+import functools
 import os
 import streamlit as st
-from typing import Dict, List, Any, Tuple
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema import HumanMessage, SystemMessage
-import json
+from typing import Dict, List, Any, AsyncIterator, Iterator, Optional, Tuple, Union
+from openai import OpenAI, AsyncOpenAI
 import re
+import orjson
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+from analysis_cache import AnalysisCache
+from keyword_scanner import get_scanner
+from resume_data import ResumeData
+
+
+# Chat model settings
+_MODEL = "gpt-3.5-turbo"
+_TEMPERATURE = 0.3
+_MAX_CONCURRENT_REQUESTS = 16
+_JSON_RESPONSE_FORMAT = {'type': 'json_object'}  # Analysis responses must be a single JSON object
+
+# On-disk analysis cache (override with the ANALYSIS_CACHE_DIR environment variable)
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'resume_analyzer')
+
+# Prompt token budget
+_CONTEXT_TOKENS = 16385
+_RESPONSE_TOKENS = 600
+_MAX_RAW_TEXT_TOKENS = 3500
+_CHARS_PER_TOKEN = 4  # Rough estimate used when tiktoken is unavailable
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Section headers recognized in plain text responses (matched case-insensitively before an
+# optional colon, ignoring markdown emphasis) and the analysis field they start
+_SECTION_HEADERS = {
+    'strengths': 'strengths',
+    'key strengths': 'strengths',
+    'weaknesses': 'weaknesses',
+    'areas for improvement': 'weaknesses',
+    'suggestions': 'suggestions',
+    'improvement suggestions': 'suggestions',
+    'specific improvement suggestions': 'suggestions',
+    'نقاط القوة': 'strengths',
+    'مجالات التحسين': 'weaknesses',
+    'اقتراحات': 'suggestions',
+    'اقتراحات محددة للتحسين': 'suggestions'
+}
+_BULLET_CHARS = '-•*·'
+_MARKDOWN_CHARS = '#* \t'
+
+# Shape of an analysis response; parsed responses are coerced to it (every property is
+# filled in, other keys are dropped)
+_ANALYSIS_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'score': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'default': 50},
+        'strengths': {'type': 'array', 'items': {'type': 'string'}},
+        'weaknesses': {'type': 'array', 'items': {'type': 'string'}},
+        'suggestions': {'type': 'array', 'items': {'type': 'string'}},
+        'improved_summary': {'type': 'string'},
+        'job_specific_suggestions': {'type': 'array', 'items': {'type': 'string'}}
+    }
+}
+
+# Analyzer methods accept the parser's dict or a typed ResumeData
+ResumeInput = Union[ResumeData, Dict[str, Any]]
+
+# Prompt templates; the resume text is appended to the analysis prompt within the token budget
+_EN_SYSTEM_PROMPT = """You are a professional resume analyst. Analyze the provided resume and score it from 0 to 100.
+
+Your analysis should include:
+1. Overall score (0-100)
+2. Key strengths
+3. Areas for improvement
+4. Specific improvement suggestions
+5. Enhanced professional summary
+
+Return a JSON response with:
+{
+    "score": number 0-100,
+    "strengths": [list of strengths],
+    "weaknesses": [list of areas for improvement],
+    "suggestions": [specific suggestions],
+    "improved_summary": "enhanced professional summary"
+}"""
+_AR_SYSTEM_PROMPT = """أنت محلل سير ذاتية محترف. قم بتحليل السيرة الذاتية المقدمة وتقييمها من 0 إلى 100.
+
+يجب أن تتضمن تحليلك:
+1. تقييم شامل (0-100)
+2. نقاط القوة
+3. مجالات التحسين
+4. اقتراحات محددة للتحسين
+5. ملخص مهني محسن
+
+أعد استجابة بتنسيق JSON يحتوي على:
+{
+    "score": عدد من 0-100,
+    "strengths": [قائمة نقاط القوة],
+    "weaknesses": [قائمة مجالات التحسين],
+    "suggestions": [اقتراحات محددة],
+    "improved_summary": "ملخص مهني محسن"
+}"""
+
+# Prebuilt system messages, shared by every request without a target job
+_SYSTEM_MSGS = {
+    'en': {'role': 'system', 'content': _EN_SYSTEM_PROMPT},
+    'ar': {'role': 'system', 'content': _AR_SYSTEM_PROMPT}
+}
+
+_EN_JOB_SYSTEM_TMPL = """
+
+The candidate is targeting the position '{job_title}'. Also include in the JSON:
+    "job_specific_suggestions": [3-5 specific suggestions to tailor the resume to this position]"""
+_AR_JOB_SYSTEM_TMPL = """
+
+المرشح يستهدف وظيفة '{job_title}'. أضف أيضاً إلى JSON:
+    "job_specific_suggestions": [3-5 اقتراحات محددة لتكييف السيرة الذاتية مع هذه الوظيفة]"""
+
+_EN_USER_TMPL = """Analyze the following resume:
+
+Name: {name}
+Summary: {summary}
+Experience: {experience}
+Education: {education}
+Skills: {skills}
+Languages: {languages}
+Certifications: {certifications}
+Projects: {projects}
+
+Full text: """
+_AR_USER_TMPL = """تحليل السيرة الذاتية التالية:
+
+الاسم: {name}
+الملخص: {summary}
+الخبرة: {experience}
+التعليم: {education}
+المهارات: {skills}
+اللغات: {languages}
+الشهادات: {certifications}
+المشاريع: {projects}
+
+النص الكامل: """
+
+_USER_TAIL = '\n'
+_EN_JOB_USER_TAIL_TMPL = 'Target job: {job_title}\n'
+_AR_JOB_USER_TAIL_TMPL = 'الوظيفة المستهدفة: {job_title}\n'
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tokenizer of the chat model (None if tiktoken is unavailable)."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(_MODEL)
+    except Exception as e:
+        print(f"Warning: Could not load tokenizer: {e}")
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count the prompt tokens of a text."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // _CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text))
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Collapse whitespace and truncate a text to a token budget.
+    
+    Args:
+        text (str): Text to truncate
+        max_tokens (int): Maximum number of tokens to keep
+        
+    Returns:
+        str: Truncated text
+    """
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+    if max_tokens <= 0:
+        return ''
+    
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * _CHARS_PER_TOKEN]
+    
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    
+    # A cut can split a multi-byte character; drop the replacement character it decodes to
+    return encoding.decode(tokens[:max_tokens]).rstrip('\ufffd')
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize resume fields to compact JSON for prompts (non-ASCII characters are kept as-is)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+
+
+def _find_json(text: str) -> Optional[str]:
+    """
+    Find the first balanced JSON object in a text.
+    
+    Args:
+        text (str): Text that may contain a JSON object
+        
+    Returns:
+        Optional[str]: The exact '{...}' span, or None if no balanced object is found
+    """
+    start = text.find('{')
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
+
+
+def _find_score(text: str) -> Optional[int]:
+    """
+    Find the first score in a plain text response: 'NN/100' or 'score: NN'.
+    
+    Returns the same match as a case-insensitive search for digits followed by '/100' or
+    'score' followed by optional colons/whitespace and digits, but uses str.find to jump
+    between candidates instead of running a regex over the text.
+    
+    Args:
+        text (str): AI response text
+        
+    Returns:
+        Optional[int]: The score, or None if the text does not contain one
+    """
+    low = text.lower()
+    length = len(low)
+    best_start = length
+    best_digits = None
+    
+    # 'score' followed by optional colons/whitespace and at least one digit
+    i = low.find('score')
+    while i >= 0:
+        j = i + 5
+        while j < length and (low[j] == ':' or low[j].isspace()):
+            j += 1
+        k = j
+        while k < length and low[k].isdecimal():
+            k += 1
+        if k > j:
+            best_start, best_digits = i, low[j:k]
+            break
+        i = low.find('score', i + 1)
+    
+    # Digits directly followed by '/100'; the first such '/100' also has the earliest digit run
+    i = low.find('/100', 0, best_start + 1)
+    while i >= 0:
+        j = i
+        while j > 0 and low[j - 1].isdecimal():
+            j -= 1
+        if j < i:
+            if j < best_start:
+                best_start, best_digits = j, low[j:i]
+            break
+        i = low.find('/100', i + 1, best_start + 1)
+    
+    return int(best_digits) if best_digits is not None else None
+
+
+def _coerce_analysis(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Coerce a parsed analysis response to `_ANALYSIS_SCHEMA`.
+    
+    Missing or mistyped fields get their defaults, scores are clamped to 0-100
+    and single strings where a list is expected are wrapped in a list.
+    
+    Args:
+        data (Dict[str, Any]): Parsed response
+        
+    Returns:
+        Dict[str, Any]: Analysis fields with the schema's types
+    """
+    analysis = {}
+    for field, spec in _ANALYSIS_SCHEMA['properties'].items():
+        value = data.get(field)
+        if spec['type'] == 'integer':
+            try:
+                value = int(float(value))
+            except (TypeError, ValueError, OverflowError):
+                value = spec['default']
+            analysis[field] = min(spec['maximum'], max(spec['minimum'], value))
+        elif spec['type'] == 'array':
+            if isinstance(value, str):
+                value = [value]
+            elif not isinstance(value, list):
+                value = []
+            analysis[field] = [str(item).strip() for item in value if item is not None and str(item).strip()]
+        else:
+            analysis[field] = value.strip() if isinstance(value, str) else ''
+    
+    return analysis
+
+
+class _JSONFieldStream:
+    """Incrementally extracts completed top-level fields from a streamed JSON object."""
+    
+    def __init__(self):
+        self.text = ''
+        self.fields: Dict[str, Any] = {}
+        self._pos = -1  # Scan position inside the object (-1 until the opening brace is seen)
+        self._done = False
+    
+    def feed(self, chunk: str) -> bool:
+        """
+        Add a chunk of the response and parse any fields it completes.
+        
+        Args:
+            chunk (str): Next piece of the streamed response
+            
+        Returns:
+            bool: True if at least one new field was completed
+        """
+        self.text += chunk
+        completed = False
+        
+        if self._pos < 0:
+            start = self.text.find('{')
+            if start < 0:
+                return False
+            self._pos = start + 1
+        
+        while not self._done:
+            member = self._next_member()
+            if member is None:
+                break
+            key, value, end = member
+            self.fields[key] = value
+            self._pos = end
+            completed = True
+        
+        return completed
+    
+    def _next_member(self) -> Optional[Tuple[str, Any, int]]:
+        """Parse the next complete `"key": value` member, or return None if it is not complete yet."""
+        text = self.text
+        key_start = self._skip(text, self._pos, ' \t\r\n,')
+        if key_start >= len(text):
+            return None
+        if text[key_start] != '"':
+            # End of the object, or not JSON we can follow; the full response is parsed at the end
+            self._done = True
+            return None
+        
+        key_end = self._string_end(text, key_start)
+        if key_end < 0:
+            return None
+        
+        colon = self._skip(text, key_end, ' \t\r\n')
+        if colon >= len(text):
+            return None
+        if text[colon] != ':':
+            self._done = True
+            return None
+        
+        value_start = self._skip(text, colon + 1, ' \t\r\n')
+        value_end = self._value_end(text, value_start)
+        if value_end < 0:
+            return None
+        
+        try:
+            key = orjson.loads(text[key_start:key_end])
+            value = orjson.loads(text[value_start:value_end])
+        except orjson.JSONDecodeError:
+            self._done = True
+            return None
+        
+        return key, value, value_end
+    
+    @staticmethod
+    def _skip(text: str, pos: int, chars: str) -> int:
+        """Skip over any of `chars` starting at `pos`."""
+        while pos < len(text) and text[pos] in chars:
+            pos += 1
+        return pos
+    
+    @staticmethod
+    def _string_end(text: str, pos: int) -> int:
+        """Return the index after the string literal starting at `pos`, or -1 if it is incomplete."""
+        escaped = False
+        for i in range(pos + 1, len(text)):
+            char = text[i]
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                return i + 1
+        return -1
+    
+    def _value_end(self, text: str, pos: int) -> int:
+        """Return the index after the JSON value starting at `pos`, or -1 if it is incomplete."""
+        if pos >= len(text):
+            return -1
+        
+        if text[pos] == '"':
+            return self._string_end(text, pos)
+        
+        if text[pos] in '[{':
+            depth = 0
+            i = pos
+            while i < len(text):
+                char = text[i]
+                if char == '"':
+                    i = self._string_end(text, i)
+                    if i < 0:
+                        return -1
+                    continue
+                if char in '[{':
+                    depth += 1
+                elif char in ']}':
+                    depth -= 1
+                    if depth == 0:
+                        return i + 1
+                i += 1
+            return -1
+        
+        # Number or literal: complete once a delimiter follows it
+        i = pos
+        while i < len(text) and text[i] not in ',}] \t\r\n':
+            i += 1
+        return i if i < len(text) else -1
 
 
 class AIAnalyzer:
@@ -29,143 +472,242 @@ class AIAnalyzer:
             self.api_key = st.secrets['OPENAI_API_KEY']
         else:
             self.api_key = os.getenv('OPENAI_API_KEY')
-            
-        if self.api_key and self.api_key != "your_openai_api_key_here":
-            try:
-                self.llm = ChatOpenAI(
-                    model="gpt-3.5-turbo",
-                    temperature=0.3,
-                    api_key=self.api_key
-                )
-            except Exception as e:
-                print(f"Warning: Could not initialize OpenAI: {e}")
-                self.llm = None
-        else:
-            self.llm = None
+        
+        # Repeated submissions of the same (or a near-identical) resume skip the LLM call,
+        # also across restarts of the app
+        self.cache = AnalysisCache(
+            persist_dir=os.path.expanduser(os.getenv('ANALYSIS_CACHE_DIR', _DEFAULT_CACHE_DIR))
+        )
+    
+    @property
+    def clients(self) -> Optional[Tuple[OpenAI, AsyncOpenAI]]:
+        """OpenAI clients, created on first use and shared between analyzers (None without an API key)."""
+        if not self.api_key or self.api_key == "your_openai_api_key_here":
+            return None
+        return AIAnalyzer._get_clients(self.api_key)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _get_clients(api_key: str) -> Optional[Tuple[OpenAI, AsyncOpenAI]]:
+        """Build the sync and async OpenAI clients once per API key."""
+        try:
+            return OpenAI(api_key=api_key, max_retries=3), AsyncOpenAI(api_key=api_key, max_retries=3)
+        except Exception as e:
+            print(f"Warning: Could not initialize OpenAI: {e}")
+            return None
     
-    def analyze_resume(self, resume_data: Dict[str, Any], language: str = 'en') -> Dict[str, Any]:
+    def _complete(self, messages: List[Dict[str, str]], json_mode: bool = False) -> str:
+        """Send a chat completion request and return the response text."""
+        client, _ = self.clients
+        response = client.chat.completions.create(
+            model=_MODEL,
+            temperature=_TEMPERATURE,
+            messages=messages,
+            **({'response_format': _JSON_RESPONSE_FORMAT} if json_mode else {})
+        )
+        return response.choices[0].message.content or ''
+    
+    async def _acomplete(self, messages: List[Dict[str, str]], json_mode: bool = False) -> str:
+        """Asynchronously send a chat completion request and return the response text."""
+        _, client = self.clients
+        response = await client.chat.completions.create(
+            model=_MODEL,
+            temperature=_TEMPERATURE,
+            messages=messages,
+            **({'response_format': _JSON_RESPONSE_FORMAT} if json_mode else {})
+        )
+        return response.choices[0].message.content or ''
+    
+    def _stream(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream a JSON-mode chat completion as text chunks."""
+        client, _ = self.clients
+        stream = client.chat.completions.create(
+            model=_MODEL,
+            temperature=_TEMPERATURE,
+            messages=messages,
+            response_format=_JSON_RESPONSE_FORMAT,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ''
+    
+    async def _astream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Asynchronously stream a JSON-mode chat completion as text chunks."""
+        _, client = self.clients
+        stream = await client.chat.completions.create(
+            model=_MODEL,
+            temperature=_TEMPERATURE,
+            messages=messages,
+            response_format=_JSON_RESPONSE_FORMAT,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ''
+    
+    def analyze_resume(self, resume_data: ResumeInput, language: str = 'en', job_title: str = None) -> Dict[str, Any]:
         """
         Analyze resume and provide comprehensive feedback.
         
         Args:
-            resume_data (Dict[str, Any]): Parsed resume data
+            resume_data (ResumeInput): Parsed resume data (dict or ResumeData)
             language (str): Language code ('en' or 'ar')
+            job_title (str): Optional target job title; when given, job-specific
+                suggestions are generated in the same AI request
             
         Returns:
             Dict[str, Any]: Analysis results including score and suggestions
         """
-        if not self.llm:
-            return self._fallback_analysis(resume_data, language)
+        return self._analyze(resume_data, language, job_title)
+    
+    def analyze_resume_with_job(self, resume_data: ResumeInput, job_title: str, language: str = 'en') -> Dict[str, Any]:
+        """
+        Analyze resume and generate job-specific suggestions in a single AI request.
         
-        try:
-            # Create analysis prompt
-            prompt = self._create_analysis_prompt(resume_data, language)
-            
-            # Get AI response
-            response = self.llm.invoke(prompt)
+        Args:
+            resume_data (ResumeInput): Parsed resume data (dict or ResumeData)
+            job_title (str): Target job title
+            language (str): Language code ('en' or 'ar')
             
-            # Parse response
-            analysis = self._parse_ai_response(response.content, language)
+        Returns:
+            Dict[str, Any]: Analysis results including a 'job_specific_suggestions' list
+        """
+        return self._analyze(resume_data, language, job_title)
+    
+    def _analyze(self, resume_data: ResumeInput, language: str, job_title: str = None) -> Dict[str, Any]:
+        """Run one analysis request (see `_aanalyze` for the async variant)."""
+        resume_data = ResumeData.from_dict(resume_data)
+        if not self.clients:
+            return self._fallback(resume_data, language, job_title)
+        
+        # Serve repeated analyses from the cache
+        cached, cache_key, namespace = self._lookup(resume_data, language, job_title)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self._complete(self._create_analysis_prompt(resume_data, language, job_title), json_mode=True)
+            return self._finish(cache_key, resume_data.raw_text, namespace, response, language)
             
-            return analysis
+        except Exception as e:
+            print(f"AI analysis error: {e}")
+            return self._fallback(resume_data, language, job_title)
+    
+    async def _aanalyze(self, resume_data: ResumeInput, language: str, job_title: str = None) -> Dict[str, Any]:
+        """Asynchronously run one analysis request (same steps as `_analyze`)."""
+        resume_data = ResumeData.from_dict(resume_data)
+        if not self.clients:
+            return self._fallback(resume_data, language, job_title)
+        
+        # Serve repeated analyses from the cache
+        cached, cache_key, namespace = self._lookup(resume_data, language, job_title)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await self._acomplete(self._create_analysis_prompt(resume_data, language, job_title), json_mode=True)
+            return self._finish(cache_key, resume_data.raw_text, namespace, response, language)
             
         except Exception as e:
             print(f"AI analysis error: {e}")
-            return self._fallback_analysis(resume_data, language)
+            return self._fallback(resume_data, language, job_title)
+    
+    def _lookup(self, resume_data: ResumeData, language: str,
+                job_title: str = None) -> Tuple[Optional[Dict[str, Any]], str, str]:
+        """
+        Look an analysis up in the cache.
+        
+        Args:
+            resume_data (ResumeData): Resume data
+            language (str): Language code ('en' or 'ar')
+            job_title (str): Optional target job title; job-specific analyses are cached apart
+            
+        Returns:
+            Tuple[Optional[Dict[str, Any]], str, str]: Cached analysis (None on a miss),
+                cache key and namespace to store a fresh analysis under
+        """
+        if job_title:
+            cache_key = self.cache.make_key(resume_data, language, _MODEL, job_title)
+            namespace = f"{language}:{job_title}"
+        else:
+            cache_key = self.cache.make_key(resume_data, language, _MODEL)
+            namespace = language
+        return self.cache.get(cache_key, resume_data.raw_text, namespace), cache_key, namespace
+    
+    def _finish(self, cache_key: str, raw_text: str, namespace: str, response: str, language: str) -> Dict[str, Any]:
+        """Parse an AI response and store the analysis in the cache."""
+        analysis = self._parse_ai_response(response, language)
+        self.cache.set(cache_key, raw_text, namespace, analysis)
+        return analysis
     
-    def _create_analysis_prompt(self, resume_data: Dict[str, Any], language: str) -> str:
+    def _fallback(self, resume_data: ResumeData, language: str, job_title: str = None) -> Dict[str, Any]:
+        """Fallback analysis, with an empty job-specific suggestions list for job analyses."""
+        analysis = self._fallback_analysis(resume_data, language)
+        if job_title:
+            analysis['job_specific_suggestions'] = []
+        return analysis
+    
+    def _create_analysis_prompt(self, resume_data: ResumeInput, language: str, job_title: str = None) -> List[Dict[str, str]]:
         """Create the analysis prompt for the AI."""
+        resume_data = ResumeData.from_dict(resume_data)
         
+        system_message = _SYSTEM_MSGS['ar' if language == 'ar' else 'en']
         if language == 'ar':
-            system_prompt = """أنت محلل سير ذاتية محترف. قم بتحليل السيرة الذاتية المقدمة وتقييمها من 0 إلى 100.
-            
-            يجب أن تتضمن تحليلك:
-            1. تقييم شامل (0-100)
-            2. نقاط القوة
-            3. مجالات التحسين
-            4. اقتراحات محددة للتحسين
-            5. ملخص مهني محسن
-            
-            أعد استجابة بتنسيق JSON يحتوي على:
-            {
-                "score": عدد من 0-100,
-                "strengths": [قائمة نقاط القوة],
-                "weaknesses": [قائمة مجالات التحسين],
-                "suggestions": [اقتراحات محددة],
-                "improved_summary": "ملخص مهني محسن"
-            }"""
-            
-            user_prompt = f"""تحليل السيرة الذاتية التالية:
-            
-            الاسم: {resume_data.get('name', 'غير محدد')}
-            الملخص: {resume_data.get('summary', 'غير محدد')}
-            الخبرة: {json.dumps(resume_data.get('experience', []), ensure_ascii=False)}
-            التعليم: {json.dumps(resume_data.get('education', []), ensure_ascii=False)}
-            المهارات: {resume_data.get('skills', [])}
-            اللغات: {resume_data.get('languages', [])}
-            الشهادات: {resume_data.get('certifications', [])}
-            المشاريع: {json.dumps(resume_data.get('projects', []), ensure_ascii=False)}
-            
-            النص الكامل: {resume_data.get('raw_text', '')[:2000]}
-            """
+            user_template = _AR_USER_TMPL
+            job_system_template = _AR_JOB_SYSTEM_TMPL
+            job_tail_template = _AR_JOB_USER_TAIL_TMPL
+            not_specified = 'غير محدد'
         else:
-            system_prompt = """You are a professional resume analyst. Analyze the provided resume and score it from 0 to 100.
-            
-            Your analysis should include:
-            1. Overall score (0-100)
-            2. Key strengths
-            3. Areas for improvement
-            4. Specific improvement suggestions
-            5. Enhanced professional summary
-            
-            Return a JSON response with:
-            {
-                "score": number 0-100,
-                "strengths": [list of strengths],
-                "weaknesses": [list of areas for improvement],
-                "suggestions": [specific suggestions],
-                "improved_summary": "enhanced professional summary"
-            }"""
-            
-            user_prompt = f"""Analyze the following resume:
-            
-            Name: {resume_data.get('name', 'Not specified')}
-            Summary: {resume_data.get('summary', 'Not specified')}
-            Experience: {json.dumps(resume_data.get('experience', []))}
-            Education: {json.dumps(resume_data.get('education', []))}
-            Skills: {resume_data.get('skills', [])}
-            Languages: {resume_data.get('languages', [])}
-            Certifications: {resume_data.get('certifications', [])}
-            Projects: {json.dumps(resume_data.get('projects', []))}
-            
-            Full text: {resume_data.get('raw_text', '')[:2000]}
-            """
+            user_template = _EN_USER_TMPL
+            job_system_template = _EN_JOB_SYSTEM_TMPL
+            job_tail_template = _EN_JOB_USER_TAIL_TMPL
+            not_specified = 'Not specified'
         
-        return [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt)
-        ]
+        user_prompt = user_template.format_map({
+            'name': resume_data.name or not_specified,
+            'summary': resume_data.summary or not_specified,
+            'experience': _dumps(resume_data.experience),
+            'education': _dumps(resume_data.education),
+            'skills': list(resume_data.skills),
+            'languages': list(resume_data.languages),
+            'certifications': list(resume_data.certifications),
+            'projects': _dumps(resume_data.projects)
+        })
+        user_tail = _USER_TAIL
+        
+        if job_title:
+            system_message = {
+                'role': 'system',
+                'content': system_message['content'] + job_system_template.format_map({'job_title': job_title})
+            }
+            user_tail += job_tail_template.format_map({'job_title': job_title})
+        
+        # Fill the remaining token budget with the (whitespace-collapsed) resume text
+        fixed_tokens = (_count_tokens(system_message['content']) + _count_tokens(user_prompt)
+                        + _count_tokens(user_tail))
+        budget = min(_CONTEXT_TOKENS - _RESPONSE_TOKENS - fixed_tokens, _MAX_RAW_TEXT_TOKENS)
+        user_prompt += _truncate_to_tokens(resume_data.raw_text, budget) + user_tail
+        
+        return [system_message, {'role': 'user', 'content': user_prompt}]
     
     def _parse_ai_response(self, response: str, language: str) -> Dict[str, Any]:
         """Parse the AI response and extract structured data."""
         try:
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-            else:
-                # If no JSON found, create structured response from text
-                data = self._extract_from_text(response, language)
+            # JSON mode responses are a bare object; otherwise extract it from the text
+            try:
+                data = orjson.loads(response)
+            except orjson.JSONDecodeError:
+                json_text = _find_json(response)
+                if json_text:
+                    data = orjson.loads(json_text)
+                else:
+                    # If no JSON found, create structured response from text
+                    data = self._extract_from_text(response, language)
             
-            # Ensure all required fields exist
-            analysis = {
-                'score': data.get('score', 50),
-                'strengths': data.get('strengths', []),
-                'weaknesses': data.get('weaknesses', []),
-                'suggestions': data.get('suggestions', []),
-                'improved_summary': data.get('improved_summary', ''),
-                'ai_response': response
-            }
+            # Ensure all required fields exist with the expected types
+            analysis = _coerce_analysis(data)
+            analysis['ai_response'] = response
             
             return analysis
             
@@ -185,71 +727,58 @@ class AIAnalyzer:
         }
         
         # Try to extract score
-        score_match = re.search(r'(\d+)/100|score[:\s]*(\d+)', text, re.IGNORECASE)
-        if score_match:
-            score = score_match.group(1) or score_match.group(2)
-            analysis['score'] = min(100, max(0, int(score)))
+        score = _find_score(text)
+        if score is not None:
+            analysis['score'] = min(100, max(0, score))
         
-        # Extract sections based on language
-        if language == 'ar':
-            # Extract strengths
-            strengths_match = re.search(r'نقاط القوة[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)', text, re.DOTALL)
-            if strengths_match:
-                strengths_text = strengths_match.group(1)
-                analysis['strengths'] = [s.strip() for s in strengths_text.split('\n') if s.strip()]
-            
-            # Extract weaknesses
-            weaknesses_match = re.search(r'مجالات التحسين[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)', text, re.DOTALL)
-            if weaknesses_match:
-                weaknesses_text = weaknesses_match.group(1)
-                analysis['weaknesses'] = [w.strip() for w in weaknesses_text.split('\n') if w.strip()]
-            
-            # Extract suggestions
-            suggestions_match = re.search(r'اقتراحات[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)', text, re.DOTALL)
-            if suggestions_match:
-                suggestions_text = suggestions_match.group(1)
-                analysis['suggestions'] = [s.strip() for s in suggestions_text.split('\n') if s.strip()]
-        else:
-            # Extract strengths
-            strengths_match = re.search(r'strengths[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-            if strengths_match:
-                strengths_text = strengths_match.group(1)
-                analysis['strengths'] = [s.strip() for s in strengths_text.split('\n') if s.strip()]
+        # One pass over the lines: a header switches the current section and the bullet
+        # lines under it become its items; a blank line or plain prose ends the section
+        current = None
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                if current and analysis[current]:
+                    current = None
+                continue
             
-            # Extract weaknesses
-            weaknesses_match = re.search(r'weaknesses[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-            if weaknesses_match:
-                weaknesses_text = weaknesses_match.group(1)
-                analysis['weaknesses'] = [w.strip() for w in weaknesses_text.split('\n') if w.strip()]
-            
-            # Extract suggestions
-            suggestions_match = re.search(r'suggestions[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-            if suggestions_match:
-                suggestions_text = suggestions_match.group(1)
-                analysis['suggestions'] = [s.strip() for s in suggestions_text.split('\n') if s.strip()]
+            head, _, rest = line.strip(_MARKDOWN_CHARS).partition(':')
+            section = _SECTION_HEADERS.get(head.strip(_MARKDOWN_CHARS).lower())
+            if section:
+                current = section
+                rest = rest.strip(_MARKDOWN_CHARS)
+                if rest:
+                    analysis[section].append(rest)
+            elif current:
+                if line[0] in _BULLET_CHARS or line[0].isdigit():
+                    item = line.lstrip(_BULLET_CHARS + '0123456789.) \t')
+                    if item:
+                        analysis[current].append(item)
+                else:
+                    current = None
         
         return analysis
     
-    def _fallback_analysis(self, resume_data: Dict[str, Any], language: str) -> Dict[str, Any]:
+    def _fallback_analysis(self, resume_data: ResumeInput, language: str) -> Dict[str, Any]:
         """Fallback analysis when AI is not available."""
+        resume_data = ResumeData.from_dict(resume_data)
         
         # Calculate basic score based on resume completeness
         score = 50  # Base score
         
         # Add points for having different sections
-        if resume_data.get('name'):
+        if resume_data.name:
             score += 5
-        if resume_data.get('summary'):
+        if resume_data.summary:
             score += 10
-        if resume_data.get('experience'):
+        if resume_data.experience:
             score += 15
-        if resume_data.get('education'):
+        if resume_data.education:
             score += 10
-        if resume_data.get('skills'):
+        if resume_data.skills:
             score += 10
         
         # Add points for contact information
-        contact_info = resume_data.get('contact_info', {})
+        contact_info = resume_data.contact_info or {}
         if contact_info.get('email'):
             score += 5
         if contact_info.get('phone'):
@@ -311,62 +840,221 @@ class AIAnalyzer:
         if not job_keywords:
             return 0.0
         
-        resume_lower = resume_text.lower()
-        matched_keywords = 0
-        
-        for keyword in job_keywords:
-            if keyword.lower() in resume_lower:
-                matched_keywords += 1
+        # One scan over the resume finds every keyword; the scanner is cached per keyword list
+        found = get_scanner(tuple(job_keywords)).find(resume_text)
+        matched_keywords = sum(1 for keyword in job_keywords if keyword.lower() in found)
         
         return matched_keywords / len(job_keywords)
     
-    def generate_job_specific_suggestions(self, resume_data: Dict[str, Any], job_title: str, language: str) -> List[str]:
+    def calculate_keyword_scores(self, resume_text: str, keyword_lists: List[List[str]]) -> List[float]:
+        """
+        Calculate keyword matching scores of a resume against many job keyword lists.
+        
+        The resume is scanned once for the union of all keywords, after which each
+        list is scored with set lookups.
+        
+        Args:
+            resume_text (str): Resume text
+            keyword_lists (List[List[str]]): Job requirement keywords, one list per job
+            
+        Returns:
+            List[float]: Matching score (0-1) per keyword list
+        """
+        all_keywords = tuple(dict.fromkeys(keyword for keywords in keyword_lists for keyword in keywords))
+        found = get_scanner(all_keywords).find(resume_text) if all_keywords else set()
+        
+        return [
+            sum(1 for keyword in keywords if keyword.lower() in found) / len(keywords) if keywords else 0.0
+            for keywords in keyword_lists
+        ]
+    
+    def generate_job_specific_suggestions(self, resume_data: ResumeInput, job_title: str, language: str) -> List[str]:
         """
         Generate job-specific improvement suggestions.
         
         Args:
-            resume_data (Dict[str, Any]): Resume data
+            resume_data (ResumeInput): Resume data (dict or ResumeData)
+            job_title (str): Target job title
+            language (str): Language code
+            
+        Returns:
+            List[str]: Job-specific suggestions
+        """
+        if not self.clients:
+            return []
+        
+        # Shares the request (and cache entry) with analyze_resume(..., job_title=job_title)
+        analysis = self.analyze_resume_with_job(resume_data, job_title, language)
+        return analysis.get('job_specific_suggestions', [])[:5]
+    
+    async def aanalyze_resume(self, resume_data: ResumeInput, language: str = 'en') -> Dict[str, Any]:
+        """
+        Asynchronously analyze resume and provide comprehensive feedback.
+        
+        Args:
+            resume_data (ResumeInput): Parsed resume data (dict or ResumeData)
+            language (str): Language code ('en' or 'ar')
+            
+        Returns:
+            Dict[str, Any]: Analysis results including score and suggestions
+        """
+        return await self._aanalyze(resume_data, language)
+    
+    async def aanalyze_resume_with_job(self, resume_data: ResumeInput, job_title: str, language: str = 'en') -> Dict[str, Any]:
+        """
+        Asynchronously analyze resume and generate job-specific suggestions in a single AI request.
+        
+        Args:
+            resume_data (ResumeInput): Parsed resume data (dict or ResumeData)
+            job_title (str): Target job title
+            language (str): Language code ('en' or 'ar')
+            
+        Returns:
+            Dict[str, Any]: Analysis results including a 'job_specific_suggestions' list
+        """
+        # Shares the cache entry with analyze_resume_with_job
+        return await self._aanalyze(resume_data, language, job_title)
+    
+    async def agenerate_job_specific_suggestions(self, resume_data: ResumeInput, job_title: str, language: str) -> List[str]:
+        """
+        Asynchronously generate job-specific improvement suggestions.
+        
+        Args:
+            resume_data (ResumeInput): Resume data (dict or ResumeData)
             job_title (str): Target job title
             language (str): Language code
             
         Returns:
             List[str]: Job-specific suggestions
         """
-        if not self.llm:
+        if not self.clients:
             return []
         
+        # Shares the request (and cache entry) with aanalyze_resume_with_job
+        analysis = await self.aanalyze_resume_with_job(resume_data, job_title, language)
+        return analysis.get('job_specific_suggestions', [])[:5]
+    
+    async def aanalyze_with_job_suggestions(self, resume_data: ResumeInput, job_title: str,
+                                            language: str = 'en') -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Run the general analysis and the job-specific suggestions as a single AI request.
+        
+        Args:
+            resume_data (ResumeInput): Parsed resume data (dict or ResumeData)
+            job_title (str): Target job title
+            language (str): Language code ('en' or 'ar')
+            
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: Analysis results and job-specific suggestions
+        """
+        analysis = await self.aanalyze_resume_with_job(resume_data, job_title, language)
+        return analysis, analysis.get('job_specific_suggestions', [])[:5]
+    
+    async def aanalyze_resumes_bulk(self, resumes: List[ResumeInput], language: str = 'en',
+                                    max_concurrency: int = _MAX_CONCURRENT_REQUESTS) -> List[Dict[str, Any]]:
+        """
+        Asynchronously analyze many resumes with a bounded number of concurrent AI requests.
+        
+        Args:
+            resumes (List[ResumeInput]): Parsed resume data (dicts or ResumeData)
+            language (str): Language code ('en' or 'ar')
+            max_concurrency (int): Maximum number of requests in flight at once
+            
+        Returns:
+            List[Dict[str, Any]]: Analysis results, in the same order as `resumes`
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze_one(resume_data: ResumeInput) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aanalyze_resume(resume_data, language)
+        
+        return list(await asyncio.gather(*(analyze_one(resume_data) for resume_data in resumes)))
+    
+    def analyze_resumes_bulk(self, resumes: List[ResumeInput], language: str = 'en',
+                             max_concurrency: int = _MAX_CONCURRENT_REQUESTS) -> List[Dict[str, Any]]:
+        """
+        Analyze many resumes, overlapping the AI requests instead of sending them one by one.
+        
+        Args:
+            resumes (List[ResumeInput]): Parsed resume data (dicts or ResumeData)
+            language (str): Language code ('en' or 'ar')
+            max_concurrency (int): Maximum number of requests in flight at once
+            
+        Returns:
+            List[Dict[str, Any]]: Analysis results, in the same order as `resumes`
+        """
+        return asyncio.run(self.aanalyze_resumes_bulk(resumes, language, max_concurrency))
+    
+    def stream_analyze(self, resume_data: ResumeInput, language: str = 'en') -> Iterator[Dict[str, Any]]:
+        """
+        Analyze resume while streaming the AI response.
+        
+        Partial results are yielded as soon as top-level fields (score, strengths, ...)
+        are complete, so a UI can render them before the whole response has arrived.
+        
+        Args:
+            resume_data (ResumeInput): Parsed resume data (dict or ResumeData)
+            language (str): Language code ('en' or 'ar')
+            
+        Yields:
+            Dict[str, Any]: Partial analysis results; the last item is the complete analysis
+        """
+        resume_data = ResumeData.from_dict(resume_data)
+        if not self.clients:
+            yield self._fallback(resume_data, language)
+            return
+        
+        cached, cache_key, namespace = self._lookup(resume_data, language)
+        if cached is not None:
+            yield cached
+            return
+        
+        stream = _JSONFieldStream()
         try:
-            if language == 'ar':
-                prompt = f"""بناءً على السيرة الذاتية والوظيفة المستهدفة '{job_title}'، قدم اقتراحات محددة لتحسين السيرة الذاتية.
-                
-                السيرة الذاتية:
-                المهارات: {resume_data.get('skills', [])}
-                الخبرة: {json.dumps(resume_data.get('experience', []), ensure_ascii=False)}
-                
-                قدم 3-5 اقتراحات محددة ومفيدة."""
-            else:
-                prompt = f"""Based on the resume and target job '{job_title}', provide specific suggestions to improve the resume.
-                
-                Resume:
-                Skills: {resume_data.get('skills', [])}
-                Experience: {json.dumps(resume_data.get('experience', []))}
-                
-                Provide 3-5 specific and actionable suggestions."""
+            for chunk in self._stream(self._create_analysis_prompt(resume_data, language)):
+                if stream.feed(chunk):
+                    yield dict(stream.fields, ai_response=stream.text)
             
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            analysis = self._finish(cache_key, resume_data.raw_text, namespace, stream.text, language)
             
-            # Extract suggestions from response
-            suggestions = []
-            lines = response.content.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and (line.startswith('-') or line.startswith('•') or line[0].isdigit()):
-                    suggestion = line.lstrip('-•0123456789. ')
-                    if suggestion:
-                        suggestions.append(suggestion)
+        except Exception as e:
+            print(f"AI analysis error: {e}")
+            analysis = self._fallback(resume_data, language)
+        
+        yield analysis
+    
+    async def astream_analyze(self, resume_data: ResumeInput, language: str = 'en') -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously analyze resume while streaming the AI response.
+        
+        Args:
+            resume_data (ResumeInput): Parsed resume data (dict or ResumeData)
+            language (str): Language code ('en' or 'ar')
             
-            return suggestions[:5]  # Limit to 5 suggestions
+        Yields:
+            Dict[str, Any]: Partial analysis results; the last item is the complete analysis
+        """
+        resume_data = ResumeData.from_dict(resume_data)
+        if not self.clients:
+            yield self._fallback(resume_data, language)
+            return
+        
+        cached, cache_key, namespace = self._lookup(resume_data, language)
+        if cached is not None:
+            yield cached
+            return
+        
+        stream = _JSONFieldStream()
+        try:
+            async for chunk in self._astream(self._create_analysis_prompt(resume_data, language)):
+                if stream.feed(chunk):
+                    yield dict(stream.fields, ai_response=stream.text)
+            
+            analysis = self._finish(cache_key, resume_data.raw_text, namespace, stream.text, language)
             
         except Exception as e:
-            print(f"Error generating job-specific suggestions: {e}")
-            return [] 
\ No newline at end of file
+            print(f"AI analysis error: {e}")
+            analysis = self._fallback(resume_data, language)
+        
+        yield analysis
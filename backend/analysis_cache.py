@@ -0,0 +1,258 @@
+"""
+Caching layer for AI resume analysis results.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+# Persistent tier defaults
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_SIZE_LIMIT = 500 * 1024 * 1024
+
+
+class AnalysisCache:
+    """
+    Cache for analysis results: exact hash lookups backed by a semantic index,
+    with an optional on-disk tier that survives process restarts.
+    """
+
+    def __init__(self, max_entries: int = 512, similarity_threshold: float = 0.95,
+                 embedding_chars: int = 2000, n_features: int = 2 ** 11,
+                 persist_dir: Optional[str] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 size_limit: int = DEFAULT_SIZE_LIMIT):
+        """
+        Initialize the analysis cache.
+
+        Args:
+            max_entries (int): Maximum number of cached analyses (least recently used are evicted)
+            similarity_threshold (float): Minimum cosine similarity for a semantic hit
+            embedding_chars (int): Number of leading resume characters used for the embedding
+            n_features (int): Dimension of the hashed text embedding
+            persist_dir (Optional[str]): Directory of the on-disk tier (None keeps the cache in memory only)
+            ttl_seconds (int): Lifetime of on-disk entries
+            size_limit (int): Maximum size of the on-disk tier in bytes
+        """
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.embedding_chars = embedding_chars
+
+        # Exact tier: cache key -> analysis, kept in LRU order
+        self._entries = OrderedDict()
+
+        # Semantic tier: one L2-normalized embedding row per cached key, stored as int8 with a
+        # per-row scale (a quarter of the float32 size; similarities move by well under 0.01).
+        # Rows are preallocated for max_entries keys and rows of evicted keys are reused;
+        # only the first _used_rows rows have ever been filled.
+        self._vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm='l2',
+            dtype=np.float32
+        )
+        self._embeddings = np.zeros((max_entries, n_features), dtype=np.int8)
+        self._scales = np.zeros(max_entries, dtype=np.float32)
+        self._row_keys: List[Optional[str]] = [None] * max_entries
+        self._row_namespaces: List[Optional[str]] = [None] * max_entries
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._used_rows = 0
+
+        self._lock = threading.Lock()
+
+        # On-disk tier: exact-key lookups only; entries read back rejoin the in-memory tiers
+        self.ttl_seconds = ttl_seconds
+        self._disk = None
+        if persist_dir and diskcache is not None:
+            try:
+                self._disk = diskcache.Cache(persist_dir, size_limit=size_limit)
+            except Exception as e:
+                print(f"Warning: Could not open analysis cache directory: {e}")
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(resume_data: Any, *parts: str) -> str:
+        """
+        Build an exact-match cache key.
+
+        Args:
+            resume_data (Any): Parsed resume data (dict or ResumeData)
+            *parts (str): Additional request parameters (language, target job, ...)
+
+        Returns:
+            str: SHA-256 hex digest of the canonicalized request
+        """
+        canonical = json.dumps([resume_data, parts], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, text: str = '', namespace: str = '') -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached analysis: by exact key (in memory, then on disk), then by text similarity.
+
+        Args:
+            key (str): Exact cache key from `make_key`
+            text (str): Raw resume text used for the semantic lookup
+            namespace (str): Only entries stored under the same namespace can match semantically
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached analysis or None on a miss
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+
+            stored = self._disk_get(key)
+            if stored is not None:
+                self._store(key, text, namespace, stored)
+                self.disk_hits += 1
+                return copy.deepcopy(stored)
+
+            if not text or not self._rows:
+                self.misses += 1
+                return None
+
+            # Free rows have no namespace, so they never match
+            used = self._used_rows
+            query = self._embed(text)
+            similarities = (self._embeddings[:used] @ query) * self._scales[:used]
+            same_namespace = np.fromiter(
+                (ns == namespace for ns in self._row_namespaces[:used]),
+                dtype=bool,
+                count=used
+            )
+            similarities[~same_namespace] = -1.0
+
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                self.misses += 1
+                return None
+
+            best_key = self._row_keys[best]
+            self._entries.move_to_end(best_key)
+            self.semantic_hits += 1
+            return copy.deepcopy(self._entries[best_key])
+
+    def set(self, key: str, text: str, namespace: str, analysis: Dict[str, Any]):
+        """
+        Store an analysis result.
+
+        Args:
+            key (str): Exact cache key from `make_key`
+            text (str): Raw resume text used for the semantic index
+            namespace (str): Namespace the entry can be matched under
+            analysis (Dict[str, Any]): Analysis result to cache
+        """
+        with self._lock:
+            self._store(key, text, namespace, copy.deepcopy(analysis))
+
+            if self._disk is not None:
+                try:
+                    self._disk.set(key, analysis, expire=self.ttl_seconds)
+                except Exception as e:
+                    print(f"Warning: Could not write analysis cache entry: {e}")
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._row_keys = [None] * self.max_entries
+            self._row_namespaces = [None] * self.max_entries
+            self._rows.clear()
+            self._free_rows = []
+            self._used_rows = 0
+
+            if self._disk is not None:
+                self._disk.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache hit and miss counts.
+
+        Returns:
+            Dict[str, int]: Exact, on-disk and semantic hits, misses and the number of in-memory entries
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'semantic_hits': self.semantic_hits,
+                'misses': self.misses,
+                'entries': len(self._entries)
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, text: str, namespace: str, analysis: Dict[str, Any]):
+        """Add an entry to the in-memory tiers (the caller holds the lock and owns `analysis`)."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._entries[key] = analysis
+            return
+
+        self._entries[key] = analysis
+
+        # Evict before embedding, so the new key can take over a freed row
+        while len(self._entries) > self.max_entries:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._drop_row(evicted_key)
+
+        if text and key in self._entries:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = self._used_rows
+                self._used_rows += 1
+            self._embeddings[row], self._scales[row] = self._quantize(self._embed(text))
+            self._row_keys[row] = key
+            self._row_namespaces[row] = namespace
+            self._rows[key] = row
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry from the on-disk tier (None if absent, expired or unreadable)."""
+        if self._disk is None:
+            return None
+        try:
+            return self._disk.get(key)
+        except Exception as e:
+            print(f"Warning: Could not read analysis cache entry: {e}")
+            return None
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed the leading part of a resume as a dense L2-normalized vector."""
+        return self._vectorizer.transform([text[:self.embedding_chars]]).toarray()[0]
+
+    @staticmethod
+    def _quantize(embedding: np.ndarray) -> Tuple[np.ndarray, np.float32]:
+        """Quantize an embedding to int8 values and the scale that maps them back."""
+        scale = np.float32(np.abs(embedding).max() / 127.0) if embedding.any() else np.float32(1.0)
+        return np.round(embedding / scale).astype(np.int8), scale
+
+    def _drop_row(self, key: str):
+        """Free the semantic index row belonging to an evicted key."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+
+        self._row_keys[row] = None
+        self._row_namespaces[row] = None
+        self._free_rows.append(row)
@@ -4,12 +4,59 @@ Job matching module for matching resumes to Dubai job listings.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+import scipy.sparse as sp
+import itertools
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 import re
 from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
 from sklearn.metrics.pairwise import cosine_similarity
 import json
 
+from keyword_scanner import KeywordScanner
+
+
+# Common technical skills
+TECHNICAL_SKILLS = [
+    'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django',
+    'flask', 'spring', 'laravel', 'sql', 'mongodb', 'postgresql', 'mysql',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'jenkins',
+    'machine learning', 'ai', 'data science', 'analytics', 'tableau',
+    'excel', 'power bi', 'spark', 'hadoop', 'tensorflow', 'pytorch'
+]
+
+# Requirement/title tokens and "N-M years" experience requirements
+_WORD_RE = re.compile(r'\b\w+\b')
+_EXP_RE = re.compile(r'(\d+)[\-\s]*(\d+)?\s*years?')
+
+# Whole-word match of any technical skill in lowercased text (skills like 'c++' end in
+# a non-word character, so lookarounds are used instead of \b); longest skills first
+_TECH_SKILL_RE = re.compile(
+    r'(?<!\w)(?:'
+    + '|'.join(re.escape(skill) for skill in sorted(TECHNICAL_SKILLS, key=len, reverse=True))
+    + r')(?!\w)'
+)
+
+# Job listing fields returned with matches and search results
+JOB_FIELDS = [
+    'title', 'company', 'location', 'salary', 'experience',
+    'description', 'requirements', 'job_type', 'industry'
+]
+
+# Keys of match and search results: the job id followed by the listing fields
+_JOB_INFO_KEYS = ('job_id',) + tuple(JOB_FIELDS)
+_MATCH_KEYS = _JOB_INFO_KEYS + ('match_score', 'match_percentage')
+
+# Job listing fields searched by `search_jobs`
+SEARCH_FIELDS = ['title', 'company', 'description', 'requirements']
+
+# Phrases indicating that a resume describes work experience
+EXPERIENCE_INDICATORS = [
+    'years of experience', 'years experience', 'worked for', 'employed for',
+    'experience in', 'professional experience', 'work history'
+]
+
 
 class JobMatcher:
     """Matches resumes to job listings using various algorithms."""
@@ -21,11 +68,12 @@ class JobMatcher:
         Args:
             jobs_data (pd.DataFrame): Job listings data
         """
-        self.jobs_data = jobs_data or self._load_default_jobs()
+        self.jobs_data = jobs_data if jobs_data is not None else self._load_default_jobs()
         self.vectorizer = TfidfVectorizer(
             stop_words='english',
             ngram_range=(1, 2),
-            max_features=1000
+            max_features=1000,
+            dtype=np.float32
         )
         self._prepare_jobs_data()
     
@@ -158,12 +206,88 @@ class JobMatcher:
                 self.jobs_data['company'].fillna('')
             )
             
-            # Create TF-IDF vectors for jobs
-            try:
-                self.job_vectors = self.vectorizer.fit_transform(self.jobs_data['combined_text'])
-            except:
-                # Fallback if vectorization fails
-                self.job_vectors = None
+            # Create TF-IDF vectors for jobs (None if there is no text to vectorize)
+            self.job_vectors = None
+            if self.jobs_data['combined_text'].str.strip().str.len().sum() > 0:
+                try:
+                    self.job_vectors = self.vectorizer.fit_transform(self.jobs_data['combined_text'])
+                except ValueError as e:
+                    # Raised when the text consists only of stop words (empty vocabulary)
+                    print(f"Warning: Could not vectorize job listings: {e}")
+            
+            # (job id, listing fields...) tuple per job, so results are built without pandas row access
+            self._job_rows = list(zip(self.jobs_data.index, *(self.jobs_data[field].to_numpy() for field in JOB_FIELDS)))
+            self._search_cols = {field: self.jobs_data[field].fillna('').str.lower() for field in SEARCH_FIELDS}
+            
+            # Lowercased industry -> row positions, and the industries in listing order
+            self._industry_index = self.jobs_data.groupby(self.jobs_data['industry'].str.lower()).indices
+            self._industries = self.jobs_data['industry'].unique().tolist()
+            
+            self._prepare_match_features()
+    
+    def _prepare_match_features(self):
+        """
+        Precompute the per-job features used for scoring, so that matching a resume
+        against all jobs is a single sparse matrix-vector product.
+        """
+        requirement_tokens = [_WORD_RE.findall(req.lower()) for req in self.jobs_data['requirements'].fillna('')]
+        title_tokens = [_WORD_RE.findall(title.lower()) for title in self.jobs_data['title'].fillna('')]
+        
+        # Shared vocabulary of requirement and title tokens
+        self._vocabulary = list(dict.fromkeys(
+            token for tokens in requirement_tokens + title_tokens for token in tokens
+        ))
+        token_ids = {token: i for i, token in enumerate(self._vocabulary)}
+        
+        # Job x token occurrence counts (repeated tokens count repeatedly, as in the keyword lists)
+        requirement_counts = self._count_matrix(requirement_tokens, token_ids)
+        title_counts = self._count_matrix(title_tokens, token_ids)
+        
+        # Job x technical skill indicator
+        skill_ids = {skill: i for i, skill in enumerate(TECHNICAL_SKILLS)}
+        job_skills = [
+            list(dict.fromkeys(_TECH_SKILL_RE.findall(req.lower())))
+            for req in self.jobs_data['requirements'].fillna('')
+        ]
+        skill_matrix = self._count_matrix(job_skills, skill_ids)
+        
+        # Each score is the fraction of a job's entries found in the resume, so the rows are
+        # L1-normalized once here and the component weights folded in: keyword (40%),
+        # title (20%) and skills (25%) scores of all jobs are then the sum of the columns
+        # of the terms [tokens, skills] found in the resume. Stored column-major so that
+        # only those columns are read.
+        self._match_matrix = sp.hstack([
+            normalize(requirement_counts, norm='l1') * 0.4 + normalize(title_counts, norm='l1') * 0.2,
+            normalize(skill_matrix, norm='l1') * 0.25
+        ], format='csc', dtype=np.float32)
+        
+        # One scanner finds every vocabulary token in a resume; skill columns follow the tokens
+        self._token_ids = token_ids
+        self._skill_ids = {skill: len(token_ids) + i for skill, i in skill_ids.items()}
+        self._token_scanner = KeywordScanner(self._vocabulary)
+        
+        # Experience requirement (min, max years) per job, and the experience scores of all
+        # jobs for a resume without / with experience indicators
+        self._exp_bounds = [
+            self._parse_experience_bounds(exp) for exp in self.jobs_data['experience'].fillna('')
+        ]
+        has_requirement = np.array([bounds is not None for bounds in self._exp_bounds], dtype=bool)
+        self._experience_scores = (
+            np.where(has_requirement, 0.0, 0.5).astype(np.float32),
+            np.where(has_requirement, 0.8, 0.5).astype(np.float32)
+        )
+    
+    @staticmethod
+    def _count_matrix(rows: List[List[str]], ids: Dict[str, int]) -> sp.csr_matrix:
+        """Build a sparse row x id occurrence count matrix."""
+        indptr = np.cumsum([0] + [len(row) for row in rows])
+        indices = np.fromiter((ids[item] for row in rows for item in row), dtype=np.int32, count=int(indptr[-1]))
+        data = np.ones(len(indices), dtype=np.float32)
+        
+        # Duplicate entries are summed into counts
+        matrix = sp.csr_matrix((data, indices, indptr), shape=(len(rows), len(ids)))
+        matrix.sum_duplicates()
+        return matrix
     
     def match_resume_to_jobs(self, resume_data: Dict[str, Any], top_n: int = 5) -> List[Dict[str, Any]]:
         """
@@ -182,188 +306,143 @@ class JobMatcher:
         # Prepare resume text for matching
         resume_text = self._prepare_resume_text(resume_data)
         
-        # Calculate matching scores
-        matches = []
+        # Score all jobs at once and keep the best ones
+        scores = self._calculate_job_match_scores(resume_text)
+        return self._top_matches(scores, top_n)
+    
+    def match_resumes_batch(self, resume_data_list: List[Dict[str, Any]], top_n: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Match several resumes to job listings at once.
         
-        for idx, job in self.jobs_data.iterrows():
-            score = self._calculate_job_match_score(resume_text, job)
-            
-            match_info = {
-                'job_id': idx,
-                'title': job['title'],
-                'company': job['company'],
-                'location': job['location'],
-                'salary': job['salary'],
-                'experience': job['experience'],
-                'description': job['description'],
-                'requirements': job['requirements'],
-                'job_type': job['job_type'],
-                'industry': job['industry'],
-                'match_score': score,
-                'match_percentage': round(score * 100, 1)
-            }
+        Args:
+            resume_data_list (List[Dict[str, Any]]): Parsed resume data of each resume
+            top_n (int): Number of top matches to return per resume
             
-            matches.append(match_info)
+        Returns:
+            List[List[Dict[str, Any]]]: Top job matches with scores, per resume in input order
+        """
+        if self.jobs_data is None or self.jobs_data.empty or not resume_data_list:
+            return [[] for _ in resume_data_list]
+        
+        resumes_lower = [self._prepare_resume_text(resume_data).lower() for resume_data in resume_data_list]
+        
+        # Resume x term hit matrix, scored against all jobs in one sparse product
+        hit_rows = [self._resume_hit_columns(resume_lower) for resume_lower in resumes_lower]
+        indptr = np.cumsum([0] + [len(row) for row in hit_rows])
+        indices = np.fromiter(itertools.chain.from_iterable(hit_rows), dtype=np.int32, count=int(indptr[-1]))
+        hits = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(hit_rows), self._match_matrix.shape[1])
+        )
+        scores = (hits @ self._match_matrix.T).toarray().astype(np.float32, copy=False)
         
-        # Sort by match score and return top matches
-        matches.sort(key=lambda x: x['match_score'], reverse=True)
-        return matches[:top_n]
+        # Experience level matching (15% weight)
+        scores += np.vstack([
+            self._calculate_experience_scores(resume_lower) for resume_lower in resumes_lower
+        ]) * np.float32(0.15)
+        np.clip(scores, 0.0, 1.0, out=scores)
+        
+        return [self._top_matches(row, top_n) for row in scores]
+    
+    def _top_matches(self, scores: np.ndarray, top_n: int) -> List[Dict[str, Any]]:
+        """Build the result dictionaries of the top scoring jobs."""
+        matches = []
+        for position in self._top_indices(scores, top_n):
+            score = round(float(scores[position]), 4)
+            matches.append(dict(zip(_MATCH_KEYS, self._job_rows[position] + (score, round(score * 100, 1)))))
+        
+        return matches
+    
+    @staticmethod
+    def _top_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+        """Select the positions of the top_n scores, best first (ties keep the listing order)."""
+        k = min(top_n, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        # Partial selection of the k-th best score; every job scoring at least that much is
+        # a candidate (ties included), and only the candidates are sorted
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        candidates = np.flatnonzero(scores >= threshold)
+        order = np.argsort(-scores[candidates], kind='stable')[:k]
+        return candidates[order]
+    
+    def _job_info(self, position: int) -> Dict[str, Any]:
+        """Build the result dictionary of the job at a row position."""
+        return dict(zip(_JOB_INFO_KEYS, self._job_rows[position]))
     
     def _prepare_resume_text(self, resume_data: Dict[str, Any]) -> str:
         """Prepare resume text for matching."""
-        text_parts = []
-        
-        # Add name
-        if resume_data.get('name'):
-            text_parts.append(resume_data['name'])
-        
-        # Add summary
-        if resume_data.get('summary'):
-            text_parts.append(resume_data['summary'])
-        
-        # Add skills
-        if resume_data.get('skills'):
-            text_parts.extend(resume_data['skills'])
-        
-        # Add experience descriptions
-        for exp in resume_data.get('experience', []):
-            if isinstance(exp, dict):
-                text_parts.append(exp.get('title', ''))
-                text_parts.append(exp.get('description', ''))
-            else:
-                text_parts.append(str(exp))
-        
-        # Add education
-        for edu in resume_data.get('education', []):
-            if isinstance(edu, dict):
-                text_parts.append(edu.get('degree', ''))
-                text_parts.append(edu.get('institution', ''))
-            else:
-                text_parts.append(str(edu))
+        # Name, summary, skills, experience, education, projects and raw text, in one join
+        parts = itertools.chain(
+            (resume_data.get('name'), resume_data.get('summary')),
+            resume_data.get('skills') or (),
+            self._entry_texts(resume_data.get('experience'), 'title', 'description'),
+            self._entry_texts(resume_data.get('education'), 'degree', 'institution'),
+            self._entry_texts(resume_data.get('projects'), 'title', 'description'),
+            (resume_data.get('raw_text'),)
+        )
         
-        # Add projects
-        for proj in resume_data.get('projects', []):
-            if isinstance(proj, dict):
-                text_parts.append(proj.get('title', ''))
-                text_parts.append(proj.get('description', ''))
+        return ' '.join(part for part in parts if part)
+    
+    @staticmethod
+    def _entry_texts(entries: List[Any], *fields: str) -> Iterator[str]:
+        """Yield the given fields of dictionary entries, or the string form of other entries."""
+        for entry in entries or ():
+            if isinstance(entry, dict):
+                for field in fields:
+                    yield entry.get(field, '')
             else:
-                text_parts.append(str(proj))
-        
-        # Add raw text
-        if resume_data.get('raw_text'):
-            text_parts.append(resume_data['raw_text'])
-        
-        return ' '.join(text_parts)
+                yield str(entry)
     
-    def _calculate_job_match_score(self, resume_text: str, job: pd.Series) -> float:
+    def _calculate_job_match_scores(self, resume_text: str) -> np.ndarray:
         """
-        Calculate match score between resume and job.
+        Calculate match scores between a resume and every job.
         
         Args:
             resume_text (str): Resume text
-            job (pd.Series): Job information
             
         Returns:
-            float: Match score (0-1)
+            np.ndarray: Match score (0-1) per job, in listing order
         """
-        score = 0.0
-        
-        # Keyword matching (40% weight)
-        keyword_score = self._calculate_keyword_score(resume_text, job)
-        score += keyword_score * 0.4
-        
-        # Title matching (20% weight)
-        title_score = self._calculate_title_match(resume_text, job['title'])
-        score += title_score * 0.2
+        resume_lower = resume_text.lower()
         
-        # Skills matching (25% weight)
-        skills_score = self._calculate_skills_match(resume_text, job['requirements'])
-        score += skills_score * 0.25
+        # Keyword (40%), title (20%) and skills (25%) matching
+        hit_columns = self._resume_hit_columns(resume_lower)
+        scores = np.asarray(self._match_matrix[:, hit_columns].sum(axis=1), dtype=np.float32).ravel()
         
         # Experience level matching (15% weight)
-        experience_score = self._calculate_experience_match(resume_text, job['experience'])
-        score += experience_score * 0.15
+        scores += self._calculate_experience_scores(resume_lower) * np.float32(0.15)
         
-        return min(1.0, max(0.0, score))
+        # Clamp in place; `scores` is a fresh array owned by this call
+        np.clip(scores, 0.0, 1.0, out=scores)
+        return scores
     
-    def _calculate_keyword_score(self, resume_text: str, job: pd.Series) -> float:
-        """Calculate keyword matching score."""
-        # Extract keywords from job requirements
-        requirements = job['requirements'].lower()
-        keywords = re.findall(r'\b\w+\b', requirements)
-        
-        if not keywords:
-            return 0.0
-        
-        # Count matches in resume
-        resume_lower = resume_text.lower()
-        matches = sum(1 for keyword in keywords if keyword in resume_lower)
-        
-        return matches / len(keywords)
+    def _resume_hit_columns(self, resume_lower: str) -> List[int]:
+        """Find the match matrix columns of the vocabulary tokens and technical skills in a resume (one scan each)."""
+        hit_columns = [self._token_ids[token] for token in self._token_scanner.find(resume_lower)]
+        hit_columns.extend(self._skill_ids[skill] for skill in set(_TECH_SKILL_RE.findall(resume_lower)))
+        return hit_columns
     
-    def _calculate_title_match(self, resume_text: str, job_title: str) -> float:
-        """Calculate title matching score."""
-        # Extract job title keywords
-        title_keywords = re.findall(r'\b\w+\b', job_title.lower())
-        
-        if not title_keywords:
-            return 0.0
-        
-        # Check for title matches in resume
-        resume_lower = resume_text.lower()
-        matches = sum(1 for keyword in title_keywords if keyword in resume_lower)
-        
-        return matches / len(title_keywords)
-    
-    def _calculate_skills_match(self, resume_text: str, job_requirements: str) -> float:
-        """Calculate skills matching score."""
-        # Common technical skills
-        technical_skills = [
-            'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django',
-            'flask', 'spring', 'laravel', 'sql', 'mongodb', 'postgresql', 'mysql',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'jenkins',
-            'machine learning', 'ai', 'data science', 'analytics', 'tableau',
-            'excel', 'power bi', 'spark', 'hadoop', 'tensorflow', 'pytorch'
-        ]
-        
-        # Extract skills from job requirements
-        req_lower = job_requirements.lower()
-        job_skills = [skill for skill in technical_skills if skill in req_lower]
-        
-        if not job_skills:
-            return 0.0
-        
-        # Check for skill matches in resume
-        resume_lower = resume_text.lower()
-        matches = sum(1 for skill in job_skills if skill in resume_lower)
+    def _calculate_experience_scores(self, resume_lower: str) -> np.ndarray:
+        """Calculate experience level matching scores for every job."""
+        # Look for experience indicators in resume
+        has_experience = any(indicator in resume_lower for indicator in EXPERIENCE_INDICATORS)
         
-        return matches / len(job_skills)
+        # Default score (0.5) if no experience requirement found; otherwise assume the
+        # candidate has some experience (0.8) if the resume mentions any
+        return self._experience_scores[has_experience]
     
-    def _calculate_experience_match(self, resume_text: str, job_experience: str) -> float:
-        """Calculate experience level matching score."""
-        # Extract years from job experience requirement
-        exp_match = re.search(r'(\d+)[\-\s]*(\d+)?\s*years?', job_experience.lower())
+    @staticmethod
+    def _parse_experience_bounds(job_experience: str) -> Optional[Tuple[int, int]]:
+        """Extract the (min, max) years of an experience requirement (None if not found)."""
+        exp_match = _EXP_RE.search(job_experience.lower())
         if not exp_match:
-            return 0.5  # Default score if no experience requirement found
+            return None
         
         min_years = int(exp_match.group(1))
         max_years = int(exp_match.group(2)) if exp_match.group(2) else min_years + 2
-        
-        # Look for experience indicators in resume
-        experience_indicators = [
-            'years of experience', 'years experience', 'worked for', 'employed for',
-            'experience in', 'professional experience', 'work history'
-        ]
-        
-        resume_lower = resume_text.lower()
-        has_experience = any(indicator in resume_lower for indicator in experience_indicators)
-        
-        if not has_experience:
-            return 0.0
-        
-        # Simple scoring based on experience presence
-        return 0.8  # Assume candidate has some experience
+        return min_years, max_years
     
     def get_job_details(self, job_id: int) -> Dict[str, Any]:
         """
@@ -378,18 +457,8 @@ class JobMatcher:
         if self.jobs_data is None or job_id >= len(self.jobs_data):
             return {}
         
-        job = self.jobs_data.iloc[job_id]
-        return {
-            'title': job['title'],
-            'company': job['company'],
-            'location': job['location'],
-            'salary': job['salary'],
-            'experience': job['experience'],
-            'description': job['description'],
-            'requirements': job['requirements'],
-            'job_type': job['job_type'],
-            'industry': job['industry']
-        }
+        # Row tuples start with the job id, followed by the listing fields
+        return dict(zip(JOB_FIELDS, self._job_rows[job_id][1:]))
     
     def search_jobs(self, query: str, top_n: int = 5) -> List[Dict[str, Any]]:
         """
@@ -405,32 +474,13 @@ class JobMatcher:
         if self.jobs_data is None or self.jobs_data.empty:
             return []
         
+        # Check if query matches job title, company, description or requirements
         query_lower = query.lower()
-        matches = []
+        mask = np.zeros(len(self.jobs_data), dtype=bool)
+        for column in self._search_cols.values():
+            mask |= column.str.contains(query_lower, regex=False).to_numpy()
         
-        for idx, job in self.jobs_data.iterrows():
-            # Check if query matches job title, company, or description
-            title_match = query_lower in job['title'].lower()
-            company_match = query_lower in job['company'].lower()
-            desc_match = query_lower in job['description'].lower()
-            req_match = query_lower in job['requirements'].lower()
-            
-            if title_match or company_match or desc_match or req_match:
-                match_info = {
-                    'job_id': idx,
-                    'title': job['title'],
-                    'company': job['company'],
-                    'location': job['location'],
-                    'salary': job['salary'],
-                    'experience': job['experience'],
-                    'description': job['description'],
-                    'requirements': job['requirements'],
-                    'job_type': job['job_type'],
-                    'industry': job['industry']
-                }
-                matches.append(match_info)
-        
-        return matches[:top_n]
+        return [self._job_info(position) for position in np.flatnonzero(mask)[:top_n]]
     
     def get_jobs_by_industry(self, industry: str) -> List[Dict[str, Any]]:
         """
@@ -445,11 +495,11 @@ class JobMatcher:
         if self.jobs_data is None or self.jobs_data.empty:
             return []
         
-        industry_jobs = self.jobs_data[
-            self.jobs_data['industry'].str.lower() == industry.lower()
-        ]
+        positions = self._industry_index.get(industry.lower())
+        if positions is None:
+            return []
         
-        return industry_jobs.to_dict('records')
+        return self.jobs_data.iloc[positions].to_dict('records')
     
     def get_available_industries(self) -> List[str]:
         """
@@ -461,4 +511,4 @@ class JobMatcher:
         if self.jobs_data is None or self.jobs_data.empty:
             return []
         
-        return self.jobs_data['industry'].unique().tolist() 
\ No newline at end of file
+        return list(self._industries)
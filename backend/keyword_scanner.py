@@ -0,0 +1,74 @@
+"""
+Single-pass keyword scanning for matching many keywords against a text.
+"""
+
+import functools
+import re
+from typing import Iterable, Set, Tuple
+
+
+class KeywordScanner:
+    """Finds which of a fixed set of keywords occur in a text with a single regex scan."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Initialize the scanner.
+
+        Args:
+            keywords (Iterable[str]): Keywords to look for (matched case-insensitively as substrings)
+        """
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+
+        # Longest keywords first so that, at any position, the longest keyword wins
+        searchable = sorted((k for k in self.keywords if k), key=len, reverse=True)
+
+        # A zero-width lookahead reports a match at every position, including overlapping ones
+        if searchable:
+            alternation = '|'.join(re.escape(keyword) for keyword in searchable)
+            self._pattern = re.compile(f'(?=({alternation}))')
+        else:
+            self._pattern = None
+
+        # At a given position only the longest keyword is reported; the shorter keywords
+        # starting there are its prefixes (keywords later inside it are reported at their own
+        # positions), so each keyword maps to the keywords among its prefixes
+        searchable_set = set(searchable)
+        self._prefixes = {
+            keyword: tuple(keyword[:i] for i in range(1, len(keyword)) if keyword[:i] in searchable_set)
+            for keyword in searchable
+        }
+        self._always_found = {''} if '' in self.keywords else set()
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Find the keywords that occur in a text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            Set[str]: Lowercased keywords found in the text
+        """
+        found = set(self._always_found)
+        if self._pattern is None:
+            return found
+
+        for keyword in set(self._pattern.findall(text.lower())):
+            found.add(keyword)
+            found.update(self._prefixes[keyword])
+
+        return found
+
+
+@functools.lru_cache(maxsize=256)
+def get_scanner(keywords: Tuple[str, ...]) -> KeywordScanner:
+    """
+    Get a (cached) scanner for a keyword list.
+
+    Args:
+        keywords (Tuple[str, ...]): Keywords to look for
+
+    Returns:
+        KeywordScanner: Scanner built for the keywords
+    """
+    return KeywordScanner(keywords)
@@ -2,9 +2,100 @@
 Language utilities for detecting and translating between Arabic and English.
 """
 
-import langdetect
-from deep_translator import GoogleTranslator
-from typing import Dict, Any
+import functools
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
+# langdetect and deep_translator are imported where they are used, so that UI-only
+# use (get_ui_texts) does not pay for loading them
+
+# Detection only looks at the start of the text; resumes are single-language in practice
+_DETECT_PREFIX_CHARS = 256
+
+# Script check on the start of the text: a share of Arabic-block characters above the upper
+# bound is Arabic, below the lower bound English; only mixed text goes to langdetect
+_SCRIPT_SAMPLE_CHARS = 4096
+_ARABIC_SHARE_BOUNDS = (0.05, 0.2)
+
+# UI texts per language; returned by reference, so callers must not modify them
+_UI_TEXTS = {
+    'en': {
+        'title': 'Resume Analyzer & Job Matcher',
+        'subtitle': 'Get Your Resume Analyzed & Matched to Top Dubai Jobs',
+        'upload_label': 'Upload your resume (PDF or DOCX)',
+        'analyze_button': 'Analyze Resume',
+        'overall_score': 'Overall Score',
+        'resume_analysis': 'Resume Analysis',
+        'suggestions': 'Improvement Suggestions',
+        'job_matches': 'Job Matches',
+        'download_report': 'Download Report',
+        'language_toggle': 'Language',
+        'loading': 'Analyzing your resume...',
+        'error_message': 'An error occurred. Please try again.',
+        'no_file': 'Please upload a resume file.',
+        'invalid_format': 'Please upload a PDF or DOCX file.',
+        'score_excellent': 'Excellent',
+        'score_good': 'Good',
+        'score_fair': 'Fair',
+        'score_poor': 'Needs Improvement',
+        'match_percentage': 'Match',
+        'company': 'Company',
+        'location': 'Location',
+        'salary': 'Salary',
+        'experience': 'Experience',
+        'skills': 'Skills',
+        'education': 'Education',
+        'contact': 'Contact Information',
+        'summary': 'Professional Summary',
+        'strengths': 'Strengths',
+        'weaknesses': 'Areas for Improvement',
+        'recommendations': 'Recommendations'
+    },
+    'ar': {
+        'title': 'محلل السيرة الذاتية ومطابق الوظائف',
+        'subtitle': 'احصل على تحليل سيرتك الذاتية ومطابقتها مع أفضل وظائف دبي',
+        'upload_label': 'قم برفع سيرتك الذاتية (PDF أو DOCX)',
+        'analyze_button': 'تحليل السيرة الذاتية',
+        'overall_score': 'الدرجة الإجمالية',
+        'resume_analysis': 'تحليل السيرة الذاتية',
+        'suggestions': 'اقتراحات التحسين',
+        'job_matches': 'الوظائف المطابقة',
+        'download_report': 'تحميل التقرير',
+        'language_toggle': 'اللغة',
+        'loading': 'جاري تحليل سيرتك الذاتية...',
+        'error_message': 'حدث خطأ. يرجى المحاولة مرة أخرى.',
+        'no_file': 'يرجى رفع ملف السيرة الذاتية.',
+        'invalid_format': 'يرجى رفع ملف PDF أو DOCX.',
+        'score_excellent': 'ممتاز',
+        'score_good': 'جيد',
+        'score_fair': 'مقبول',
+        'score_poor': 'يحتاج تحسين',
+        'match_percentage': 'مطابقة',
+        'company': 'الشركة',
+        'location': 'الموقع',
+        'salary': 'الراتب',
+        'experience': 'الخبرة',
+        'skills': 'المهارات',
+        'education': 'التعليم',
+        'contact': 'معلومات الاتصال',
+        'summary': 'الملخص المهني',
+        'strengths': 'نقاط القوة',
+        'weaknesses': 'مجالات التحسين',
+        'recommendations': 'التوصيات'
+    }
+}
+
+# Score thresholds (highest first) and their UI text keys
+_SCORE_BUCKETS = ((85, 'score_excellent'), (70, 'score_good'), (50, 'score_fair'), (0, 'score_poor'))
+
+
+@functools.lru_cache(maxsize=2048)
+def _detect_cached(prefix: str) -> str:
+    """Run langdetect on a text prefix (repeated strings are answered from the cache)."""
+    import langdetect
+    
+    return langdetect.detect(prefix)
 
 
 class LanguageProcessor:
@@ -12,7 +103,9 @@ class LanguageProcessor:
     
     def __init__(self):
         self.supported_languages = ['en', 'ar']
-        self.translator = GoogleTranslator()
+        
+        # (target language, source text) -> translation, so repeated strings skip the network
+        self._trans_cache: Dict[Tuple[str, str], str] = {}
     
     def detect_language(self, text: str) -> str:
         """
@@ -24,8 +117,15 @@ class LanguageProcessor:
         Returns:
             str: Language code ('en' for English, 'ar' for Arabic)
         """
+        # Clearly single-script input skips the n-gram classifier entirely
+        arabic_share = self._arabic_share(text[:_SCRIPT_SAMPLE_CHARS])
+        if arabic_share > _ARABIC_SHARE_BOUNDS[1]:
+            return 'ar'
+        if arabic_share < _ARABIC_SHARE_BOUNDS[0]:
+            return 'en'
+        
         try:
-            lang = langdetect.detect(text)
+            lang = _detect_cached(text[:_DETECT_PREFIX_CHARS])
             # Map common variations to our supported languages
             if lang in ['en', 'en-US', 'en-GB']:
                 return 'en'
@@ -36,6 +136,17 @@ class LanguageProcessor:
         except:
             return 'en'  # Default to English on error
     
+    @staticmethod
+    def _arabic_share(text: str) -> float:
+        """Fraction of the characters of a text in the Arabic Unicode block (U+0600-U+06FF)."""
+        if not text:
+            return 0.0
+        
+        # One code point per uint32, compared in bulk
+        codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        arabic = np.count_nonzero((codepoints >= 0x0600) & (codepoints <= 0x06FF))
+        return arabic / len(codepoints)
+    
     def translate_text(self, text: str, target_lang: str) -> str:
         """
         Translate text to target language.
@@ -50,6 +161,10 @@ class LanguageProcessor:
         if not text or target_lang not in self.supported_languages:
             return text
         
+        cached = self._trans_cache.get((target_lang, text))
+        if cached is not None:
+            return cached
+        
         try:
             # Detect source language
             source_lang = self.detect_language(text)
@@ -59,12 +174,48 @@ class LanguageProcessor:
                 return text
             
             # Translate
+            from deep_translator import GoogleTranslator
+            
             translator = GoogleTranslator(source=source_lang, target=target_lang)
-            return translator.translate(text)
+            translated = translator.translate(text)
+            self._trans_cache[(target_lang, text)] = translated
+            return translated
         except Exception as e:
             print(f"Translation error: {e}")
             return text
     
+    def translate_batch(self, texts: List[str], target_lang: str) -> List[str]:
+        """
+        Translate several texts to the target language in one request.
+        
+        Args:
+            texts (List[str]): Texts to translate
+            target_lang (str): Target language code ('en' or 'ar')
+            
+        Returns:
+            List[str]: Translated texts, in input order (untranslated on error)
+        """
+        if target_lang not in self.supported_languages:
+            return list(texts)
+        
+        # Only texts that are neither empty nor cached go over the network, each once
+        pending = list(dict.fromkeys(
+            text for text in texts if text and (target_lang, text) not in self._trans_cache
+        ))
+        
+        if pending:
+            try:
+                from deep_translator import GoogleTranslator
+                
+                translator = GoogleTranslator(source='auto', target=target_lang)
+                for text, translated in zip(pending, translator.translate_batch(pending)):
+                    if translated is not None:
+                        self._trans_cache[(target_lang, text)] = translated
+            except Exception as e:
+                print(f"Translation error: {e}")
+        
+        return [self._trans_cache.get((target_lang, text), text) if text else text for text in texts]
+    
     def get_ui_texts(self, language: str) -> Dict[str, str]:
         """
         Get UI texts in the specified language.
@@ -75,74 +226,7 @@ class LanguageProcessor:
         Returns:
             Dict[str, str]: Dictionary of UI texts
         """
-        texts = {
-            'en': {
-                'title': 'Resume Analyzer & Job Matcher',
-                'subtitle': 'Get Your Resume Analyzed & Matched to Top Dubai Jobs',
-                'upload_label': 'Upload your resume (PDF or DOCX)',
-                'analyze_button': 'Analyze Resume',
-                'overall_score': 'Overall Score',
-                'resume_analysis': 'Resume Analysis',
-                'suggestions': 'Improvement Suggestions',
-                'job_matches': 'Job Matches',
-                'download_report': 'Download Report',
-                'language_toggle': 'Language',
-                'loading': 'Analyzing your resume...',
-                'error_message': 'An error occurred. Please try again.',
-                'no_file': 'Please upload a resume file.',
-                'invalid_format': 'Please upload a PDF or DOCX file.',
-                'score_excellent': 'Excellent',
-                'score_good': 'Good',
-                'score_fair': 'Fair',
-                'score_poor': 'Needs Improvement',
-                'match_percentage': 'Match',
-                'company': 'Company',
-                'location': 'Location',
-                'salary': 'Salary',
-                'experience': 'Experience',
-                'skills': 'Skills',
-                'education': 'Education',
-                'contact': 'Contact Information',
-                'summary': 'Professional Summary',
-                'strengths': 'Strengths',
-                'weaknesses': 'Areas for Improvement',
-                'recommendations': 'Recommendations'
-            },
-            'ar': {
-                'title': 'محلل السيرة الذاتية ومطابق الوظائف',
-                'subtitle': 'احصل على تحليل سيرتك الذاتية ومطابقتها مع أفضل وظائف دبي',
-                'upload_label': 'قم برفع سيرتك الذاتية (PDF أو DOCX)',
-                'analyze_button': 'تحليل السيرة الذاتية',
-                'overall_score': 'الدرجة الإجمالية',
-                'resume_analysis': 'تحليل السيرة الذاتية',
-                'suggestions': 'اقتراحات التحسين',
-                'job_matches': 'الوظائف المطابقة',
-                'download_report': 'تحميل التقرير',
-                'language_toggle': 'اللغة',
-                'loading': 'جاري تحليل سيرتك الذاتية...',
-                'error_message': 'حدث خطأ. يرجى المحاولة مرة أخرى.',
-                'no_file': 'يرجى رفع ملف السيرة الذاتية.',
-                'invalid_format': 'يرجى رفع ملف PDF أو DOCX.',
-                'score_excellent': 'ممتاز',
-                'score_good': 'جيد',
-                'score_fair': 'مقبول',
-                'score_poor': 'يحتاج تحسين',
-                'match_percentage': 'مطابقة',
-                'company': 'الشركة',
-                'location': 'الموقع',
-                'salary': 'الراتب',
-                'experience': 'الخبرة',
-                'skills': 'المهارات',
-                'education': 'التعليم',
-                'contact': 'معلومات الاتصال',
-                'summary': 'الملخص المهني',
-                'strengths': 'نقاط القوة',
-                'weaknesses': 'مجالات التحسين',
-                'recommendations': 'التوصيات'
-            }
-        }
-        
-        return texts.get(language, texts['en'])
+        return _UI_TEXTS.get(language, _UI_TEXTS['en'])
     
     def format_score_description(self, score: int, language: str) -> str:
         """
@@ -157,11 +241,7 @@ class LanguageProcessor:
         """
         texts = self.get_ui_texts(language)
         
-        if score >= 85:
-            return texts['score_excellent']
-        elif score >= 70:
-            return texts['score_good']
-        elif score >= 50:
-            return texts['score_fair']
-        else:
-            return texts['score_poor'] 
\ No newline at end of file
+        for threshold, key in _SCORE_BUCKETS:
+            if score >= threshold:
+                return texts[key]
+        return texts['score_poor']
@@ -2,76 +2,215 @@
 PDF generator for creating professional resume analysis reports.
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from typing import Dict, List, Any
+from reportlab import rl_config
+from typing import Dict, List, Any, BinaryIO, Iterable, Optional, Tuple, Union
+import functools
+import io
+import multiprocessing
+from bisect import bisect_right
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime
+from xml.sax.saxutils import escape
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_reportlab() -> None:
+    """
+    Set up ReportLab for report generation (once per process, when the first generator is created).
+    
+    Page streams are compressed (ReportLab's default) and the ASCII85 encoding on top of it is
+    skipped. rl_config is global, so this deliberately applies to every PDF the process writes.
+    """
+    rl_config.useA85 = 0
+    
+    # ReportLab falls back to pure-Python string width and escaping routines without the
+    # rl_accel C extension; generate_many workers leave the warning to their parent process
+    if multiprocessing.parent_process() is None:
+        try:
+            import _rl_accel
+        except ImportError:
+            print("Warning: rl_accel not installed. PDF generation will use ReportLab's slower pure-Python routines.")
+
+# Report labels per language (reports in any language other than English use Arabic)
+LABELS = {
+    'en': {
+        'title': 'Resume Analysis Report',
+        'generated_on': 'Generated on: {timestamp}',
+        'candidate_info': 'Candidate Information',
+        'name': 'Name',
+        'not_specified': 'Not specified',
+        'email': 'Email',
+        'phone': 'Phone',
+        'skills': 'Skills',
+        'overall_score': 'Overall Score',
+        'score_bands': ('Needs Improvement', 'Fair', 'Good', 'Excellent'),
+        'detailed_analysis': 'Detailed Analysis',
+        'strengths': 'Strengths',
+        'weaknesses': 'Areas for Improvement',
+        'improved_summary': 'Enhanced Professional Summary',
+        'job_matches': 'Job Matches',
+        'no_job_matches': 'No job matches found.',
+        'job_headers': ('Job Title', 'Company', 'Match %', 'Salary', 'Experience'),
+        'recommendations': 'Recommendations',
+        'improvement_suggestions': 'Improvement Suggestions',
+        'no_suggestions': 'No specific suggestions available.',
+        'summary_title': 'Resume Analysis Summary',
+        'summary_score': 'Score: {score}',
+        'key_points': 'Key Points',
+        'summary_strengths': 'Strengths:',
+        'summary_suggestions': 'Suggestions:'
+    },
+    'ar': {
+        'title': 'تقرير تحليل السيرة الذاتية',
+        'generated_on': 'تم إنشاؤه في: {timestamp}',
+        'candidate_info': 'معلومات المرشح',
+        'name': 'الاسم',
+        'not_specified': 'غير محدد',
+        'email': 'البريد الإلكتروني',
+        'phone': 'الهاتف',
+        'skills': 'المهارات',
+        'overall_score': 'الدرجة الإجمالية',
+        'score_bands': ('يحتاج تحسين', 'مقبول', 'جيد', 'ممتاز'),
+        'detailed_analysis': 'التحليل المفصل',
+        'strengths': 'نقاط القوة',
+        'weaknesses': 'مجالات التحسين',
+        'improved_summary': 'الملخص المهني المحسن',
+        'job_matches': 'الوظائف المطابقة',
+        'no_job_matches': 'لم يتم العثور على وظائف مطابقة.',
+        'job_headers': ('المسمى الوظيفي', 'الشركة', 'نسبة المطابقة', 'الراتب', 'الخبرة'),
+        'recommendations': 'التوصيات',
+        'improvement_suggestions': 'اقتراحات التحسين',
+        'no_suggestions': 'لا توجد اقتراحات محددة متاحة.',
+        'summary_title': 'ملخص تحليل السيرة الذاتية',
+        'summary_score': 'الدرجة: {score}',
+        'key_points': 'النقاط الرئيسية',
+        'summary_strengths': 'نقاط القوة:',
+        'summary_suggestions': 'الاقتراحات:'
+    }
+}
+# Report colors and fonts, shared by the paragraph and table styles
+_PRIMARY_COLOR = colors.darkblue
+_SUBSECTION_COLOR = colors.darkgreen
+_BOLD_FONT = 'Helvetica-Bold'
+
+# Lower bounds of the Fair, Good and Excellent score bands (LABELS 'score_bands' order)
+_SCORE_THRESHOLDS = (50, 70, 85)
+# "N/100" texts of the integer scores
+_SCORE_TEXTS = tuple(f"{score}/100" for score in range(101))
+
+# Job match fields shown in the job matches table, in column order
+_job_row_fields = itemgetter('title', 'company', 'match_percentage', 'salary', 'experience')
+
+# Table styles of the candidate information and job matches tables
+CANDIDATE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), _BOLD_FONT),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+JOB_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _PRIMARY_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), _BOLD_FONT),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 9)
+])
 
 
 class PDFGenerator:
     """Generates professional PDF reports for resume analysis."""
     
+    # Paragraph styles are shared by all instances and built by the first one
+    _styles_ready = False
+    
     def __init__(self):
         """Initialize the PDF generator."""
-        self.styles = getSampleStyleSheet()
+        _configure_reportlab()
         self._setup_custom_styles()
+        
+        # Document templates are reused between reports, one set per thread since a build
+        # mutates its template
+        self._local = threading.local()
     
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
+    @classmethod
+    def _setup_custom_styles(cls):
+        """Setup custom paragraph styles (once per process)."""
+        if cls._styles_ready:
+            return
+        
+        cls.styles = getSampleStyleSheet()
+        
         # Title style
-        self.title_style = ParagraphStyle(
+        cls.title_style = ParagraphStyle(
             'CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=cls.styles['Heading1'],
             fontSize=24,
             spaceAfter=30,
             alignment=TA_CENTER,
-            textColor=colors.darkblue
+            textColor=_PRIMARY_COLOR
         )
         
         # Section header style
-        self.section_style = ParagraphStyle(
+        cls.section_style = ParagraphStyle(
             'CustomSection',
-            parent=self.styles['Heading2'],
+            parent=cls.styles['Heading2'],
             fontSize=16,
             spaceAfter=12,
             spaceBefore=20,
-            textColor=colors.darkblue
+            textColor=_PRIMARY_COLOR
         )
         
         # Subsection style
-        self.subsection_style = ParagraphStyle(
+        cls.subsection_style = ParagraphStyle(
             'CustomSubsection',
-            parent=self.styles['Heading3'],
+            parent=cls.styles['Heading3'],
             fontSize=14,
             spaceAfter=8,
             spaceBefore=12,
-            textColor=colors.darkgreen
+            textColor=_SUBSECTION_COLOR
         )
         
         # Normal text style
-        self.normal_style = ParagraphStyle(
+        cls.normal_style = ParagraphStyle(
             'CustomNormal',
-            parent=self.styles['Normal'],
+            parent=cls.styles['Normal'],
             fontSize=11,
             spaceAfter=6,
             leading=14
         )
         
         # Score style
-        self.score_style = ParagraphStyle(
+        cls.score_style = ParagraphStyle(
             'CustomScore',
-            parent=self.styles['Normal'],
+            parent=cls.styles['Normal'],
             fontSize=18,
             spaceAfter=10,
             alignment=TA_CENTER,
-            textColor=colors.darkblue,
-            fontName='Helvetica-Bold'
+            textColor=_PRIMARY_COLOR,
+            fontName=_BOLD_FONT
         )
+        
+        cls._styles_ready = True
     
     def generate_analysis_report(self, 
                                 resume_data: Dict[str, Any], 
@@ -92,230 +231,259 @@ class PDFGenerator:
         Returns:
             str: Path to generated PDF file
         """
-        doc = SimpleDocTemplate(output_path, pagesize=A4)
+        pdf_bytes = self.generate_analysis_report_bytes(resume_data, analysis_results, job_matches, language)
+        
+        # One write of the finished document
+        with open(output_path, 'wb') as f:
+            f.write(pdf_bytes)
+        return output_path
+    
+    def generate_analysis_report_bytes(self,
+                                       resume_data: Dict[str, Any],
+                                       analysis_results: Dict[str, Any],
+                                       job_matches: List[Dict[str, Any]],
+                                       language: str = 'en') -> bytes:
+        """
+        Generate a comprehensive PDF report in memory.
+        
+        Args:
+            resume_data (Dict[str, Any]): Parsed resume data
+            analysis_results (Dict[str, Any]): AI analysis results
+            job_matches (List[Dict[str, Any]]): Job matches
+            language (str): Language code ('en' or 'ar')
+            
+        Returns:
+            bytes: Content of the PDF file
+        """
+        buffer = io.BytesIO()
+        doc = self._doc_template(buffer)
         story = []
+        labels = self._labels(language)
         
         # Add title
-        title_text = "Resume Analysis Report" if language == 'en' else "تقرير تحليل السيرة الذاتية"
-        story.append(Paragraph(title_text, self.title_style))
+        story.append(_label_paragraph(labels['title'], self.title_style))
         story.append(Spacer(1, 20))
         
         # Add timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        timestamp_text = f"Generated on: {timestamp}" if language == 'en' else f"تم إنشاؤه في: {timestamp}"
-        story.append(Paragraph(timestamp_text, self.normal_style))
+        timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
+        story.append(Paragraph(labels['generated_on'].format(timestamp=timestamp), self.normal_style))
         story.append(Spacer(1, 30))
         
         # Add candidate information
-        story.extend(self._add_candidate_info(resume_data, language))
+        story.extend(self._add_candidate_info(resume_data, labels))
         
         # Add overall score
-        story.extend(self._add_overall_score(analysis_results, language))
+        story.extend(self._add_overall_score(analysis_results, labels))
+        
+        # Nothing else to report (e.g. a stub analysis): skip the empty sections
+        has_details = job_matches or any(
+            analysis_results.get(field) for field in ('strengths', 'weaknesses', 'improved_summary', 'suggestions')
+        )
+        if not has_details:
+            doc.build(story)
+            return buffer.getvalue()
         
         # Add detailed analysis
-        story.extend(self._add_detailed_analysis(analysis_results, language))
+        story.extend(self._add_detailed_analysis(analysis_results, labels))
         
         # Add job matches
-        story.extend(self._add_job_matches(job_matches, language))
+        story.extend(self._add_job_matches(job_matches, labels))
         
         # Add recommendations
-        story.extend(self._add_recommendations(analysis_results, language))
+        story.extend(self._add_recommendations(analysis_results, labels))
         
         # Build PDF
         doc.build(story)
-        return output_path
+        return buffer.getvalue()
+    
+    @classmethod
+    def generate_many(cls,
+                      jobs: List[Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]], str, str]],
+                      max_workers: Optional[int] = None) -> List[str]:
+        """
+        Generate several comprehensive PDF reports in parallel worker processes.
+        
+        Args:
+            jobs (List[Tuple]): (resume_data, analysis_results, job_matches, language, output_path) per report
+            max_workers (Optional[int]): Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List[str]: Paths to the generated PDF files, in job order
+        """
+        if not jobs:
+            return []
+        
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(_build_report, [cls] * len(jobs), jobs))
+    
+    def _doc_template(self, output_path: Union[str, BinaryIO], pagesize=A4) -> BaseDocTemplate:
+        """Get this thread's document template for a page size, pointed at the output path or buffer."""
+        templates = getattr(self._local, 'templates', None)
+        if templates is None:
+            templates = self._local.templates = {}
+        
+        doc = templates.get(pagesize)
+        if doc is None:
+            # Same layout as SimpleDocTemplate: one full-page frame inside the default margins
+            doc = BaseDocTemplate(output_path, pagesize=pagesize)
+            frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+            doc.addPageTemplates([PageTemplate(id='Normal', frames=frame, pagesize=pagesize)])
+            templates[pagesize] = doc
+        
+        doc.filename = output_path
+        return doc
+    
+    @staticmethod
+    def _labels(language: str) -> Dict[str, Any]:
+        """Get the report labels of a language."""
+        return LABELS['en'] if language == 'en' else LABELS['ar']
     
-    def _add_candidate_info(self, resume_data: Dict[str, Any], language: str) -> List:
+    def _add_candidate_info(self, resume_data: Dict[str, Any], labels: Dict[str, Any]) -> List:
         """Add candidate information section."""
         elements = []
         
         # Section header
-        section_title = "Candidate Information" if language == 'en' else "معلومات المرشح"
-        elements.append(Paragraph(section_title, self.section_style))
+        elements.append(_label_paragraph(labels['candidate_info'], self.section_style))
         
         # Create candidate info table
         candidate_data = []
         
         # Name
-        name_label = "Name" if language == 'en' else "الاسم"
-        name_value = resume_data.get('name', 'Not specified') if language == 'en' else resume_data.get('name', 'غير محدد')
-        candidate_data.append([name_label, name_value])
+        candidate_data.append([labels['name'], resume_data.get('name', labels['not_specified'])])
         
         # Contact information
         contact_info = resume_data.get('contact_info', {})
         if contact_info.get('email'):
-            email_label = "Email" if language == 'en' else "البريد الإلكتروني"
-            candidate_data.append([email_label, contact_info['email']])
+            candidate_data.append([labels['email'], contact_info['email']])
         
         if contact_info.get('phone'):
-            phone_label = "Phone" if language == 'en' else "الهاتف"
-            candidate_data.append([phone_label, contact_info['phone']])
+            candidate_data.append([labels['phone'], contact_info['phone']])
         
         # Skills
         if resume_data.get('skills'):
-            skills_label = "Skills" if language == 'en' else "المهارات"
-            skills_value = ', '.join(resume_data['skills'][:10])  # Limit to first 10 skills
-            candidate_data.append([skills_label, skills_value])
+            skills_value = ', '.join(islice(resume_data['skills'], 10))  # Limit to first 10 skills
+            candidate_data.append([labels['skills'], skills_value])
         
         # Create table
         if candidate_data:
             table = Table(candidate_data, colWidths=[2*inch, 4*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            table.setStyle(CANDIDATE_TABLE_STYLE)
             elements.append(table)
         
         elements.append(Spacer(1, 20))
         return elements
     
-    def _add_overall_score(self, analysis_results: Dict[str, Any], language: str) -> List:
+    def _add_overall_score(self, analysis_results: Dict[str, Any], labels: Dict[str, Any]) -> List:
         """Add overall score section."""
         elements = []
         
         # Section header
-        section_title = "Overall Score" if language == 'en' else "الدرجة الإجمالية"
-        elements.append(Paragraph(section_title, self.section_style))
+        elements.append(_label_paragraph(labels['overall_score'], self.section_style))
         
         # Score
         score = analysis_results.get('score', 0)
-        score_text = f"{score}/100" if language == 'en' else f"{score}/100"
-        elements.append(Paragraph(score_text, self.score_style))
+        elements.append(_label_paragraph(_score_text(score), self.score_style))
         
         # Score description
-        if score >= 85:
-            description = "Excellent" if language == 'en' else "ممتاز"
-        elif score >= 70:
-            description = "Good" if language == 'en' else "جيد"
-        elif score >= 50:
-            description = "Fair" if language == 'en' else "مقبول"
-        else:
-            description = "Needs Improvement" if language == 'en' else "يحتاج تحسين"
+        description = labels['score_bands'][bisect_right(_SCORE_THRESHOLDS, score)]
         
-        elements.append(Paragraph(description, self.normal_style))
+        elements.append(_label_paragraph(description, self.normal_style))
         elements.append(Spacer(1, 20))
         
         return elements
     
-    def _add_detailed_analysis(self, analysis_results: Dict[str, Any], language: str) -> List:
+    def _add_detailed_analysis(self, analysis_results: Dict[str, Any], labels: Dict[str, Any]) -> List:
         """Add detailed analysis section."""
         elements = []
         
         # Section header
-        section_title = "Detailed Analysis" if language == 'en' else "التحليل المفصل"
-        elements.append(Paragraph(section_title, self.section_style))
+        elements.append(_label_paragraph(labels['detailed_analysis'], self.section_style))
         
         # Strengths
         strengths = analysis_results.get('strengths', [])
         if strengths:
-            strengths_title = "Strengths" if language == 'en' else "نقاط القوة"
-            elements.append(Paragraph(strengths_title, self.subsection_style))
+            elements.append(_label_paragraph(labels['strengths'], self.subsection_style))
             
-            for strength in strengths:
-                elements.append(Paragraph(f"• {strength}", self.normal_style))
+            elements.append(self._list_paragraph(f"• {escape(str(strength))}" for strength in strengths))
             elements.append(Spacer(1, 10))
         
         # Weaknesses
         weaknesses = analysis_results.get('weaknesses', [])
         if weaknesses:
-            weaknesses_title = "Areas for Improvement" if language == 'en' else "مجالات التحسين"
-            elements.append(Paragraph(weaknesses_title, self.subsection_style))
+            elements.append(_label_paragraph(labels['weaknesses'], self.subsection_style))
             
-            for weakness in weaknesses:
-                elements.append(Paragraph(f"• {weakness}", self.normal_style))
+            elements.append(self._list_paragraph(f"• {escape(str(weakness))}" for weakness in weaknesses))
             elements.append(Spacer(1, 10))
         
         # Improved summary
         improved_summary = analysis_results.get('improved_summary', '')
         if improved_summary:
-            summary_title = "Enhanced Professional Summary" if language == 'en' else "الملخص المهني المحسن"
-            elements.append(Paragraph(summary_title, self.subsection_style))
+            elements.append(_label_paragraph(labels['improved_summary'], self.subsection_style))
             elements.append(Paragraph(improved_summary, self.normal_style))
             elements.append(Spacer(1, 10))
         
         elements.append(Spacer(1, 20))
         return elements
     
-    def _add_job_matches(self, job_matches: List[Dict[str, Any]], language: str) -> List:
+    def _add_job_matches(self, job_matches: List[Dict[str, Any]], labels: Dict[str, Any]) -> List:
         """Add job matches section."""
+        # Common case without matches: a fixed section built from the memoized label markup
+        # (flowables are not shared between reports, since layout stores state on them)
+        if not job_matches:
+            return [
+                _label_paragraph(labels['job_matches'], self.section_style),
+                _label_paragraph(labels['no_job_matches'], self.normal_style),
+                Spacer(1, 20)
+            ]
+        
         elements = []
         
         # Section header
-        section_title = "Job Matches" if language == 'en' else "الوظائف المطابقة"
-        elements.append(Paragraph(section_title, self.section_style))
+        elements.append(_label_paragraph(labels['job_matches'], self.section_style))
         
-        if not job_matches:
-            no_matches = "No job matches found." if language == 'en' else "لم يتم العثور على وظائف مطابقة."
-            elements.append(Paragraph(no_matches, self.normal_style))
-        else:
-            # Create job matches table
-            job_data = []
-            
-            # Table headers
-            if language == 'en':
-                headers = ['Job Title', 'Company', 'Match %', 'Salary', 'Experience']
-            else:
-                headers = ['المسمى الوظيفي', 'الشركة', 'نسبة المطابقة', 'الراتب', 'الخبرة']
-            
-            job_data.append(headers)
-            
-            # Add job matches
-            for job in job_matches[:5]:  # Limit to top 5 matches
-                job_data.append([
-                    job['title'],
-                    job['company'],
-                    f"{job['match_percentage']}%",
-                    job['salary'],
-                    job['experience']
-                ])
-            
-            # Create table
-            table = Table(job_data, colWidths=[1.5*inch, 1.5*inch, 0.8*inch, 1.2*inch, 1*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTSIZE', (0, 1), (-1, -1), 9)
-            ]))
-            elements.append(table)
+        # Create job matches table: header row, then one tuple row per match
+        top_jobs = job_matches[:5]  # Limit to top 5 matches
+        job_data = [None] * (len(top_jobs) + 1)
+        job_data[0] = labels['job_headers']
+        
+        # Add job matches
+        for i, job in enumerate(top_jobs, 1):
+            title, company, match_percentage, salary, experience = _job_row_fields(job)
+            job_data[i] = (title, company, f"{match_percentage}%", salary, experience)
+        
+        # Create table
+        table = Table(job_data, colWidths=[1.5*inch, 1.5*inch, 0.8*inch, 1.2*inch, 1*inch])
+        table.setStyle(JOB_TABLE_STYLE)
+        elements.append(table)
         
         elements.append(Spacer(1, 20))
         return elements
     
-    def _add_recommendations(self, analysis_results: Dict[str, Any], language: str) -> List:
+    def _add_recommendations(self, analysis_results: Dict[str, Any], labels: Dict[str, Any]) -> List:
         """Add recommendations section."""
         elements = []
         
         # Section header
-        section_title = "Recommendations" if language == 'en' else "التوصيات"
-        elements.append(Paragraph(section_title, self.section_style))
+        elements.append(_label_paragraph(labels['recommendations'], self.section_style))
         
         # Suggestions
         suggestions = analysis_results.get('suggestions', [])
         if suggestions:
-            suggestions_title = "Improvement Suggestions" if language == 'en' else "اقتراحات التحسين"
-            elements.append(Paragraph(suggestions_title, self.subsection_style))
+            elements.append(_label_paragraph(labels['improvement_suggestions'], self.subsection_style))
             
-            for i, suggestion in enumerate(suggestions, 1):
-                elements.append(Paragraph(f"{i}. {suggestion}", self.normal_style))
+            elements.append(self._list_paragraph(
+                f"{i}. {escape(str(suggestion))}" for i, suggestion in enumerate(suggestions, 1)
+            ))
         else:
-            no_suggestions = "No specific suggestions available." if language == 'en' else "لا توجد اقتراحات محددة متاحة."
-            elements.append(Paragraph(no_suggestions, self.normal_style))
+            elements.append(_label_paragraph(labels['no_suggestions'], self.normal_style))
         
         elements.append(Spacer(1, 20))
         return elements
     
+    def _list_paragraph(self, lines: Iterable[str]) -> Paragraph:
+        """Render list items as one paragraph with a line break between items (items must be XML-escaped)."""
+        return Paragraph('<br/>'.join(lines), self.normal_style)
+    
     def generate_simple_report(self, 
                               resume_data: Dict[str, Any], 
                               analysis_results: Dict[str, Any], 
@@ -333,41 +501,58 @@ class PDFGenerator:
         Returns:
             str: Path to generated PDF file
         """
-        doc = SimpleDocTemplate(output_path, pagesize=A4)
+        doc = self._doc_template(output_path)
         story = []
+        labels = self._labels(language)
         
         # Add title
-        title_text = "Resume Analysis Summary" if language == 'en' else "ملخص تحليل السيرة الذاتية"
-        story.append(Paragraph(title_text, self.title_style))
+        story.append(_label_paragraph(labels['summary_title'], self.title_style))
         story.append(Spacer(1, 30))
         
         # Add score
         score = analysis_results.get('score', 0)
-        score_text = f"Score: {score}/100" if language == 'en' else f"الدرجة: {score}/100"
-        story.append(Paragraph(score_text, self.score_style))
+        story.append(Paragraph(labels['summary_score'].format(score=_score_text(score)), self.score_style))
         story.append(Spacer(1, 20))
         
         # Add key points
-        key_points_title = "Key Points" if language == 'en' else "النقاط الرئيسية"
-        story.append(Paragraph(key_points_title, self.section_style))
+        story.append(_label_paragraph(labels['key_points'], self.section_style))
         
         # Strengths
         strengths = analysis_results.get('strengths', [])
         if strengths:
-            strengths_title = "Strengths:" if language == 'en' else "نقاط القوة:"
-            story.append(Paragraph(strengths_title, self.subsection_style))
-            for strength in strengths[:3]:  # Limit to 3
-                story.append(Paragraph(f"• {strength}", self.normal_style))
+            story.append(_label_paragraph(labels['summary_strengths'], self.subsection_style))
+            story.extend(Paragraph(f"• {strength}", self.normal_style) for strength in strengths[:3])  # Limit to 3
             story.append(Spacer(1, 10))
         
         # Suggestions
         suggestions = analysis_results.get('suggestions', [])
         if suggestions:
-            suggestions_title = "Suggestions:" if language == 'en' else "الاقتراحات:"
-            story.append(Paragraph(suggestions_title, self.subsection_style))
-            for suggestion in suggestions[:3]:  # Limit to 3
-                story.append(Paragraph(f"• {suggestion}", self.normal_style))
+            story.append(_label_paragraph(labels['summary_suggestions'], self.subsection_style))
+            story.extend(Paragraph(f"• {suggestion}", self.normal_style) for suggestion in suggestions[:3])  # Limit to 3
         
         # Build PDF
         doc.build(story)
-        return output_path 
\ No newline at end of file
+        return output_path
+
+
+@functools.lru_cache(maxsize=512)
+def _parsed_frags(text: str, style: ParagraphStyle) -> list:
+    """Parse paragraph markup once per (text, style); the fragments are only read during layout."""
+    return Paragraph(text, style).frags
+
+
+def _label_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """Create a paragraph of a fixed report label, reusing its parsed markup."""
+    return Paragraph(text, style, frags=_parsed_frags(text, style))
+
+
+def _score_text(score: Any) -> str:
+    """Format a score as "N/100" (table lookup for integer scores)."""
+    if isinstance(score, int) and 0 <= score <= 100:
+        return _SCORE_TEXTS[score]
+    return f"{score}/100"
+
+
+def _build_report(generator_cls: type, job: Tuple) -> str:
+    """Generate one report of `PDFGenerator.generate_many` (runs in a worker process)."""
+    return generator_cls().generate_analysis_report(*job)
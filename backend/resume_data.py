@@ -0,0 +1,67 @@
+"""
+Typed container for parsed resume data.
+"""
+
+from typing import Dict, Any, NamedTuple, Optional, Tuple, Union
+
+
+class ResumeData(NamedTuple):
+    """Immutable, tuple-backed view of the parsed resume fields."""
+
+    name: str = ''
+    summary: str = ''
+    contact_info: Optional[Dict[str, str]] = None  # None unless given; from_dict always sets a dict
+    experience: Tuple[Dict[str, str], ...] = ()
+    education: Tuple[Dict[str, str], ...] = ()
+    skills: Tuple[str, ...] = ()
+    languages: Tuple[str, ...] = ()
+    certifications: Tuple[str, ...] = ()
+    projects: Tuple[Dict[str, str], ...] = ()
+    raw_text: str = ''
+
+    @classmethod
+    def from_dict(cls, data: Union['ResumeData', Dict[str, Any]]) -> 'ResumeData':
+        """
+        Build a ResumeData from the dictionary returned by the resume parser.
+
+        Args:
+            data (Union[ResumeData, Dict[str, Any]]): Parsed resume data (returned as-is if already typed)
+
+        Returns:
+            ResumeData: Typed resume data
+        """
+        if isinstance(data, cls):
+            return data
+
+        return cls(
+            name=data.get('name') or '',
+            summary=data.get('summary') or '',
+            contact_info=data.get('contact_info') or {},
+            experience=tuple(data.get('experience') or ()),
+            education=tuple(data.get('education') or ()),
+            skills=tuple(data.get('skills') or ()),
+            languages=tuple(data.get('languages') or ()),
+            certifications=tuple(data.get('certifications') or ()),
+            projects=tuple(data.get('projects') or ()),
+            raw_text=data.get('raw_text') or ''
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert back to the parser's dictionary format.
+
+        Returns:
+            Dict[str, Any]: Parsed resume data
+        """
+        return {
+            'raw_text': self.raw_text,
+            'contact_info': dict(self.contact_info or {}),
+            'name': self.name,
+            'summary': self.summary,
+            'experience': list(self.experience),
+            'education': list(self.education),
+            'skills': list(self.skills),
+            'languages': list(self.languages),
+            'certifications': list(self.certifications),
+            'projects': list(self.projects)
+        }
@@ -5,28 +5,106 @@ Resume parser for extracting text and structure from PDF and DOCX files.
 import pdfplumber
 import fitz  # PyMuPDF
 from docx import Document
+from docx.oxml.ns import qn
 import re
-import spacy
-from typing import Dict, List, Any, Optional
+import functools
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 import os
+import copy
+import hashlib
+import io
+from collections import OrderedDict
+from itertools import islice
+
+
+# Text cleaning
+_DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF\-\.\,\;\:\!\?\(\)]')
+
+# Contact information
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Starts and ends with a digit and is bounded in length, so a failed match gives up quickly
+_PHONE_RE = re.compile(r'\+?\(?\d[\d\s\-().]{8,18}\d')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w\-]+')
+
+# Section header keywords, in priority order: a section starts after the first occurrence
+# of its highest-priority keyword found in the text
+SECTION_KEYWORDS = {
+    'summary': ['summary', 'objective', 'profile', 'ملخص', 'الهدف'],
+    'experience': ['experience', 'work history', 'employment', 'الخبرة', 'العمل'],
+    'education': ['education', 'academic', 'التعليم', 'الدراسة'],
+    'skills': ['skills', 'technical skills', 'competencies', 'المهارات', 'الخبرات'],
+    'languages': ['languages', 'اللغات'],
+    'certifications': ['certifications', 'certificates', 'الشهادات'],
+    'projects': ['projects', 'المشاريع']
+}
+
+# Maximum length of a section's text
+MAX_SECTION_CHARS = 4000
+
+# Separator between a header and its section text, and the section ends (a blank line before
+# a letter; the summary also ends at any line starting with a letter)
+_SECTION_SEPARATOR_RE = re.compile(r'[:\s]*')
+_SECTION_END_RE = re.compile(r'\n\s*\n\s*[A-Z]', re.IGNORECASE)
+_SUMMARY_END_RE = re.compile(r'\n\s*\n|\n\s*[A-Z]', re.IGNORECASE)
+
+# spaCy is only used for entity recognition, so the other pipeline components are not loaded
+_SPACY_DISABLED = ['parser', 'tagger', 'attribute_ruler', 'lemmatizer', 'morphologizer']
+
+# Body-level DOCX paragraph element (what Document.paragraphs wraps)
+_DOCX_PARAGRAPH_TAG = qn('w:p')
+
+# Leading characters of a resume searched for the candidate's name with NER
+NAME_NER_CHARS = 500
+
+# Number of parsed resumes kept in memory, keyed by file content
+PARSE_CACHE_SIZE = 256
+
+# Words that mark a line as something other than the candidate's name (matched in lowercased text)
+_NOT_A_NAME_RE = re.compile('resume|cv|curriculum|vitae|experience|education|skills')
+
+# Lines starting a new experience, education or project entry
+_JOB_TITLE_RE = re.compile(r'(senior|junior|lead|manager|director|engineer|developer|analyst|consultant)', re.IGNORECASE)
+_DEGREE_RE = re.compile(r'(bachelor|master|phd|diploma|certificate|degree)', re.IGNORECASE)
+_PROJECT_TITLE_RE = re.compile(r'(project|application|system|platform|website|app)', re.IGNORECASE)
+
+# Maximum number of items taken from a skills, languages or certifications list
+MAX_SKILLS = 20
+
+# Skill list delimiters, tried in order
+_SKILL_DELIMITER_RES = [
+    re.compile(r'[,\n;]'),     # Comma, newline, semicolon
+    re.compile(r'\s+and\s+'),  # "and" separator
+    re.compile(r'\s+&\s+'),    # "&" separator
+]
 
 
 class ResumeParser:
     """Parses resumes from PDF and DOCX files and extracts structured information."""
     
     def __init__(self):
-        # Load spaCy models for both languages
-        try:
-            self.nlp_en = spacy.load("en_core_web_sm")
-        except:
-            self.nlp_en = None
-            
+        # (SHA-256 of the file content, extension) -> parsed resume, kept in LRU order
+        self._parse_cache = OrderedDict()
+    
+    @functools.cached_property
+    def nlp_en(self):
+        """English spaCy pipeline, loaded on first use (None if unavailable)."""
+        return self._load_spacy_model("en_core_web_sm")
+    
+    @functools.cached_property
+    def nlp_ar(self):
+        """Arabic spaCy pipeline, loaded on first use (falls back to the English one)."""
         # Arabic model might not be available for all spaCy versions
+        nlp = self._load_spacy_model("ar_core_news_sm")
+        return nlp if nlp is not None else self.nlp_en
+    
+    @staticmethod
+    def _load_spacy_model(name: str):
+        """Load a spaCy model with only the components needed for NER (None on failure)."""
         try:
-            self.nlp_ar = spacy.load("ar_core_news_sm")
+            import spacy
+            return spacy.load(name, disable=_SPACY_DISABLED)
         except:
-            # Fallback: try to use English model for Arabic text
-            self.nlp_ar = self.nlp_en
+            return None
     
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
         """
@@ -38,49 +116,128 @@ class ResumeParser:
         Returns:
             Dict[str, Any]: Structured resume data
         """
+        return self.parse_resumes([file_path])[0]
+    
+    def parse_resumes(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse several resume files: text is extracted from all files first, then structured.
+        
+        Args:
+            file_paths (List[str]): Paths to the resume files
+            
+        Returns:
+            List[Dict[str, Any]]: Structured resume data per file, in input order
+        """
+        # Unsupported files fail before any parsing work is done
+        file_extensions = [self._file_extension(file_path) for file_path in file_paths]
+        
+        return self._parse_documents(
+            (self._read_file(file_path), file_extension)
+            for file_path, file_extension in zip(file_paths, file_extensions)
+        )
+    
+    def parse_resume_bytes(self, data: bytes, file_name: str) -> Dict[str, Any]:
+        """
+        Parse a resume held in memory (such as an upload) and extract structured information.
+        
+        Args:
+            data (bytes): Content of the resume file
+            file_name (str): Name of the file; only its extension is used
+            
+        Returns:
+            Dict[str, Any]: Structured resume data
+        """
+        return self._parse_documents([(data, self._file_extension(file_name))])[0]
+    
+    def _parse_documents(self, documents: Iterable[Tuple[bytes, str]]) -> List[Dict[str, Any]]:
+        """Parse (file content, extension) pairs: text is extracted from all documents first, then structured."""
+        # The same resume is often uploaded several times; each distinct file is parsed at most once.
+        # Text is extracted from the bytes that were hashed.
+        cache_keys = []
+        parsed = {}
+        texts = {}
+        for data, file_extension in documents:
+            cache_key = (hashlib.sha256(data).hexdigest(), file_extension)
+            cache_keys.append(cache_key)
+            if cache_key in parsed or cache_key in texts:
+                continue
+            if cache_key in self._parse_cache:
+                self._parse_cache.move_to_end(cache_key)
+                parsed[cache_key] = self._parse_cache[cache_key]
+            elif file_extension == '.pdf':
+                texts[cache_key] = self._extract_pdf_text(data)
+            else:
+                texts[cache_key] = self._extract_docx_text(data)
+        
+        for cache_key, text in texts.items():
+            parsed[cache_key] = self._extract_structure(text)
+        
+        # Names the line heuristic missed come from spaCy NER, run as one batch over all new resumes
+        unnamed = [cache_key for cache_key in texts if not parsed[cache_key]['name']]
+        names = self._extract_person_names([parsed[cache_key]['raw_text'] for cache_key in unnamed])
+        for cache_key, name in zip(unnamed, names):
+            parsed[cache_key]['name'] = name
+        
+        for cache_key in texts:
+            self._parse_cache[cache_key] = parsed[cache_key]
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        
+        # Callers get their own copies, so the cached results stay untouched
+        return [copy.deepcopy(parsed[cache_key]) for cache_key in cache_keys]
+    
+    @staticmethod
+    def _read_file(file_path: str) -> bytes:
+        """Read the content of a resume file."""
+        with open(file_path, 'rb') as f:
+            return f.read()
+    
+    def _file_extension(self, file_path: str) -> str:
+        """Get the lowercased extension of a resume file, rejecting unsupported formats."""
         file_extension = os.path.splitext(file_path)[1].lower()
         
-        if file_extension == '.pdf':
-            return self._parse_pdf(file_path)
-        elif file_extension == '.docx':
-            return self._parse_docx(file_path)
-        else:
+        if file_extension not in ('.pdf', '.docx'):
             raise ValueError("Unsupported file format. Please upload PDF or DOCX.")
+        
+        return file_extension
     
-    def _parse_pdf(self, file_path: str) -> Dict[str, Any]:
-        """Parse PDF resume using multiple methods for better extraction."""
-        text = ""
+    def _extract_pdf_text(self, data: bytes) -> str:
+        """Extract text from a PDF resume using multiple methods for better extraction."""
+        pages = []
         
-        # Try pdfplumber first
+        # Try PyMuPDF first (much faster than pdfminer-based pdfplumber)
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            with fitz.open(stream=data, filetype="pdf") as doc:
+                for page in doc:
+                    pages.append(page.get_text("text"))
         except:
             pass
         
-        # If pdfplumber fails, try PyMuPDF
+        text = "\n".join(pages)
+        
+        # If PyMuPDF finds no text, try pdfplumber
         if not text.strip():
+            pages = []
             try:
-                doc = fitz.open(file_path)
-                for page in doc:
-                    text += page.get_text() + "\n"
-                doc.close()
+                with pdfplumber.open(io.BytesIO(data)) as pdf:
+                    for page in pdf.pages:
+                        page_text = page.extract_text()
+                        if page_text:
+                            pages.append(page_text)
             except:
                 pass
+            
+            text = "\n".join(pages)
         
-        return self._extract_structure(text)
+        return text
     
-    def _parse_docx(self, file_path: str) -> Dict[str, Any]:
-        """Parse DOCX resume."""
+    def _extract_docx_text(self, data: bytes) -> str:
+        """Extract text from a DOCX resume."""
         try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return self._extract_structure(text)
+            doc = Document(io.BytesIO(data))
+            # Read paragraph text straight from the XML, without building Paragraph wrappers
+            body = doc.element.body
+            return "\n".join(paragraph.text for paragraph in body.iterchildren(_DOCX_PARAGRAPH_TAG))
         except Exception as e:
             raise ValueError(f"Error parsing DOCX file: {str(e)}")
     
@@ -97,28 +254,68 @@ class ResumeParser:
         # Clean and normalize text
         text = self._clean_text(text)
         
+        # Locate all sections in one scan, then parse each section's own text
+        sections = self._find_sections(text)
+        
         # Extract different sections
         resume_data = {
             'raw_text': text,
             'contact_info': self._extract_contact_info(text),
             'name': self._extract_name(text),
-            'summary': self._extract_summary(text),
-            'experience': self._extract_experience(text),
-            'education': self._extract_education(text),
-            'skills': self._extract_skills(text),
-            'languages': self._extract_languages(text),
-            'certifications': self._extract_certifications(text),
-            'projects': self._extract_projects(text)
+            'summary': self._extract_summary(sections.get('summary')),
+            'experience': self._extract_experience(sections.get('experience')),
+            'education': self._extract_education(sections.get('education')),
+            'skills': self._extract_skills(sections.get('skills')),
+            'languages': self._extract_languages(sections.get('languages')),
+            'certifications': self._extract_certifications(sections.get('certifications')),
+            'projects': self._extract_projects(sections.get('projects'))
         }
         
         return resume_data
     
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text."""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+    def _find_sections(self, text: str) -> Dict[str, str]:
+        """
+        Locate the text of each resume section.
+        
+        Args:
+            text (str): Cleaned resume text
+            
+        Returns:
+            Dict[str, str]: Section text per section name (sections without a header are absent)
+        """
+        # Offsets in the lowercased text must line up with the original text, so characters
+        # whose lowercase form is longer (such as 'İ') only keep its first character
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = ''.join(c.lower()[0] for c in text)
+        
+        sections = {}
+        for section, keywords in SECTION_KEYWORDS.items():
+            # Plain substring search (str.find) is much faster than a regex scan for fixed keywords
+            for keyword in keywords:
+                header_start = lowered.find(keyword)
+                if header_start != -1:
+                    break
+            else:
+                continue
+            
+            start = _SECTION_SEPARATOR_RE.match(text, header_start + len(keyword)).end()
+            # Sections are capped in length, which bounds the work on single-blob text (bad OCR)
+            end = start + MAX_SECTION_CHARS
+            end_re = _SUMMARY_END_RE if section == 'summary' else _SECTION_END_RE
+            end_match = end_re.search(text, start, end)
+            sections[section] = text[start:end_match.start() if end_match else end]
+        
+        return sections
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def _clean_text(text: str) -> str:
+        """Clean and normalize text (pure, so repeated texts are answered from the cache)."""
+        # Remove extra whitespace (str.split splits on the same characters as \s)
+        text = ' '.join(text.split())
         # Remove special characters but keep Arabic and English
-        text = re.sub(r'[^\w\s\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF\-\.\,\;\:\!\?\(\)]', '', text)
+        text = _DISALLOWED_CHARS_RE.sub('', text)
         return text.strip()
     
     def _extract_contact_info(self, text: str) -> Dict[str, str]:
@@ -126,26 +323,17 @@ class ResumeParser:
         contact_info = {}
         
         # Email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             contact_info['email'] = email_match.group()
         
-        # Phone (multiple formats)
-        phone_patterns = [
-            r'\+?[\d\s\-\(\)]{10,}',  # International format
-            r'[\d\s\-\(\)]{10,}',     # Local format
-        ]
-        
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
-            if phone_match:
-                contact_info['phone'] = phone_match.group().strip()
-                break
+        # Phone (international and local formats)
+        phone_match = _PHONE_RE.search(text)
+        if phone_match:
+            contact_info['phone'] = phone_match.group()
         
         # LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/[\w\-]+'
-        linkedin_match = re.search(linkedin_pattern, text)
+        linkedin_match = _LINKEDIN_RE.search(text)
         if linkedin_match:
             contact_info['linkedin'] = linkedin_match.group()
         
@@ -159,251 +347,108 @@ class ResumeParser:
             line = line.strip()
             if line and len(line.split()) <= 4:  # Name should be 1-4 words
                 # Check if it doesn't contain typical resume keywords
-                keywords = ['resume', 'cv', 'curriculum', 'vitae', 'experience', 'education', 'skills']
-                if not any(keyword.lower() in line.lower() for keyword in keywords):
+                if not _NOT_A_NAME_RE.search(line.lower()):
                     return line
         return ""
     
-    def _extract_summary(self, text: str) -> str:
-        """Extract professional summary."""
-        # Look for summary section
-        summary_patterns = [
-            r'summary[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)',
-            r'objective[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)',
-            r'profile[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)',
-            r'ملخص[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)',
-            r'الهدف[:\s]*(.*?)(?=\n\s*\n|\n\s*[A-Z]|$)'
+    def _extract_person_names(self, texts: List[str]) -> List[str]:
+        """Find the first PERSON entity near the start of each text with spaCy NER ('' if none)."""
+        if not texts or self.nlp_en is None:
+            return [''] * len(texts)
+        
+        # The name sits at the top of a resume, so NER cost does not grow with resume length
+        heads = (text[:NAME_NER_CHARS] for text in texts)
+        return [
+            next((ent.text for ent in doc.ents if ent.label_ == 'PERSON'), '')
+            for doc in self.nlp_en.pipe(heads, batch_size=32)
         ]
-        
-        for pattern in summary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
-        
-        return ""
     
-    def _extract_experience(self, text: str) -> List[Dict[str, str]]:
-        """Extract work experience."""
-        experience = []
-        
-        # Look for experience section
-        exp_patterns = [
-            r'experience[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'work history[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'employment[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'الخبرة[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'العمل[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)'
-        ]
-        
-        for pattern in exp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                exp_text = match.group(1)
-                # Parse individual experiences
-                exp_entries = self._parse_experience_entries(exp_text)
-                experience.extend(exp_entries)
-                break
-        
-        return experience
+    def _extract_summary(self, section_text: Optional[str]) -> str:
+        """Extract professional summary."""
+        return section_text.strip() if section_text is not None else ""
     
-    def _parse_experience_entries(self, exp_text: str) -> List[Dict[str, str]]:
-        """Parse individual experience entries."""
-        entries = []
-        lines = exp_text.split('\n')
-        
-        current_entry = {}
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_entry:
-                    entries.append(current_entry)
-                    current_entry = {}
-                continue
-            
-            # Look for job title patterns
-            if re.search(r'(senior|junior|lead|manager|director|engineer|developer|analyst|consultant)', line, re.IGNORECASE):
-                if current_entry:
-                    entries.append(current_entry)
-                current_entry = {'title': line}
-            elif current_entry and 'title' in current_entry:
-                # Add to description
-                if 'description' not in current_entry:
-                    current_entry['description'] = line
-                else:
-                    current_entry['description'] += ' ' + line
-        
-        if current_entry:
-            entries.append(current_entry)
+    def _extract_experience(self, section_text: Optional[str]) -> List[Dict[str, str]]:
+        """Extract work experience."""
+        if section_text is None:
+            return []
         
-        return entries
+        # Parse individual experiences
+        return self._parse_entries(section_text, _JOB_TITLE_RE, 'title', 'description')
     
-    def _extract_education(self, text: str) -> List[Dict[str, str]]:
+    def _extract_education(self, section_text: Optional[str]) -> List[Dict[str, str]]:
         """Extract education information."""
-        education = []
-        
-        # Look for education section
-        edu_patterns = [
-            r'education[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'academic[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'التعليم[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'الدراسة[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)'
-        ]
-        
-        for pattern in edu_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                edu_text = match.group(1)
-                # Parse education entries
-                edu_entries = self._parse_education_entries(edu_text)
-                education.extend(edu_entries)
-                break
-        
-        return education
-    
-    def _parse_education_entries(self, edu_text: str) -> List[Dict[str, str]]:
-        """Parse individual education entries."""
-        entries = []
-        lines = edu_text.split('\n')
-        
-        current_entry = {}
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_entry:
-                    entries.append(current_entry)
-                    current_entry = {}
-                continue
-            
-            # Look for degree patterns
-            if re.search(r'(bachelor|master|phd|diploma|certificate|degree)', line, re.IGNORECASE):
-                if current_entry:
-                    entries.append(current_entry)
-                current_entry = {'degree': line}
-            elif current_entry and 'degree' in current_entry:
-                # Add to institution
-                if 'institution' not in current_entry:
-                    current_entry['institution'] = line
-                else:
-                    current_entry['institution'] += ' ' + line
-        
-        if current_entry:
-            entries.append(current_entry)
+        if section_text is None:
+            return []
         
-        return entries
+        # Parse education entries
+        return self._parse_entries(section_text, _DEGREE_RE, 'degree', 'institution')
     
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, section_text: Optional[str]) -> List[str]:
         """Extract skills from resume."""
-        skills = []
-        
-        # Look for skills section
-        skills_patterns = [
-            r'skills[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'technical skills[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'competencies[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'المهارات[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'الخبرات[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)'
-        ]
+        if section_text is None:
+            return []
         
-        for pattern in skills_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                skills_text = match.group(1)
-                # Extract individual skills
-                skills = self._parse_skills_list(skills_text)
-                break
-        
-        return skills
+        # Extract individual skills
+        return self._parse_skills_list(section_text)
     
     def _parse_skills_list(self, skills_text: str) -> List[str]:
         """Parse skills from text."""
         skills = []
         
-        # Split by common delimiters
-        skill_patterns = [
-            r'[,\n;]',  # Comma, newline, semicolon
-            r'\s+and\s+',  # "and" separator
-            r'\s+&\s+',    # "&" separator
-        ]
-        
-        for pattern in skill_patterns:
-            if re.search(pattern, skills_text):
-                skill_list = re.split(pattern, skills_text)
-                skills = [skill.strip() for skill in skill_list if skill.strip()]
+        # Split by common delimiters, stopping once enough skills are found
+        for pattern in _SKILL_DELIMITER_RES:
+            if pattern.search(skills_text):
+                stripped = (skill.strip() for skill in pattern.split(skills_text))
+                skills = list(islice(filter(None, stripped), MAX_SKILLS))
                 break
         
         if not skills:
             # If no delimiters found, try to extract individual skills
-            words = skills_text.split()
-            skills = [word.strip() for word in words if len(word.strip()) > 2]
+            words = (word for word in skills_text.split() if len(word) > 2)
+            skills = list(islice(words, MAX_SKILLS))
         
-        return skills[:20]  # Limit to 20 skills
+        return skills
     
-    def _extract_languages(self, text: str) -> List[str]:
+    def _extract_languages(self, section_text: Optional[str]) -> List[str]:
         """Extract language skills."""
-        languages = []
-        
-        # Common language patterns
-        lang_patterns = [
-            r'languages[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'اللغات[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)'
-        ]
+        if section_text is None:
+            return []
         
-        for pattern in lang_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                lang_text = match.group(1)
-                languages = self._parse_skills_list(lang_text)
-                break
-        
-        return languages
+        return self._parse_skills_list(section_text)
     
-    def _extract_certifications(self, text: str) -> List[str]:
+    def _extract_certifications(self, section_text: Optional[str]) -> List[str]:
         """Extract certifications."""
-        certifications = []
+        if section_text is None:
+            return []
         
-        # Look for certifications section
-        cert_patterns = [
-            r'certifications[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'certificates[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'الشهادات[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)'
-        ]
-        
-        for pattern in cert_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                cert_text = match.group(1)
-                certifications = self._parse_skills_list(cert_text)
-                break
-        
-        return certifications
+        return self._parse_skills_list(section_text)
     
-    def _extract_projects(self, text: str) -> List[Dict[str, str]]:
+    def _extract_projects(self, section_text: Optional[str]) -> List[Dict[str, str]]:
         """Extract projects information."""
-        projects = []
-        
-        # Look for projects section
-        proj_patterns = [
-            r'projects[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)',
-            r'المشاريع[:\s]*(.*?)(?=\n\s*\n\s*[A-Z]|$)'
-        ]
+        if section_text is None:
+            return []
         
-        for pattern in proj_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                proj_text = match.group(1)
-                # Parse project entries
-                projects = self._parse_project_entries(proj_text)
-                break
-        
-        return projects
+        # Parse project entries
+        return self._parse_entries(section_text, _PROJECT_TITLE_RE, 'title', 'description')
     
-    def _parse_project_entries(self, proj_text: str) -> List[Dict[str, str]]:
-        """Parse individual project entries."""
+    def _parse_entries(self, section_text: str, header_re: re.Pattern, head_key: str, body_key: str) -> List[Dict[str, str]]:
+        """
+        Parse a section into entries, each starting at a line that matches `header_re`.
+        
+        Args:
+            section_text (str): Text of the section
+            header_re (re.Pattern): Pattern identifying the first line of an entry
+            head_key (str): Key for the entry's first line ('title', 'degree')
+            body_key (str): Key for the entry's following lines, joined with spaces
+            
+        Returns:
+            List[Dict[str, str]]: Parsed entries
+        """
         entries = []
-        lines = proj_text.split('\n')
+        is_header = header_re.search
         
         current_entry = {}
-        for line in lines:
+        for line in section_text.splitlines():
             line = line.strip()
             if not line:
                 if current_entry:
@@ -411,19 +456,18 @@ class ResumeParser:
                     current_entry = {}
                 continue
             
-            # Look for project title patterns
-            if re.search(r'(project|application|system|platform|website|app)', line, re.IGNORECASE):
+            if is_header(line):
                 if current_entry:
                     entries.append(current_entry)
-                current_entry = {'title': line}
-            elif current_entry and 'title' in current_entry:
-                # Add to description
-                if 'description' not in current_entry:
-                    current_entry['description'] = line
+                current_entry = {head_key: line}
+            elif current_entry:
+                # Add to the entry body
+                if body_key not in current_entry:
+                    current_entry[body_key] = line
                 else:
-                    current_entry['description'] += ' ' + line
+                    current_entry[body_key] += ' ' + line
         
         if current_entry:
             entries.append(current_entry)
         
-        return entries 
\ No newline at end of file
+        return entries
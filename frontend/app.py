@@ -4,8 +4,9 @@ Main Streamlit application for the Bilingual Resume Analyzer & Job Matcher.
 
 import streamlit as st
 import sys
-import os
-import tempfile
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add backend to path
@@ -16,7 +17,9 @@ from resume_parser import ResumeParser
 from ai_analyzer import AIAnalyzer
 from job_matcher import JobMatcher
 from language_utils import LanguageProcessor
-from pdf_generator import PDFGenerator
+
+# Seconds between checks while a PDF report renders in the background
+REPORT_POLL_SECONDS = 0.5
 
 # Page configuration
 st.set_page_config(
@@ -26,8 +29,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling (whitespace collapsed, as it is sent to the browser on every rerun)
+CUSTOM_CSS = ' '.join("""
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -120,19 +123,66 @@ st.markdown("""
         text-align: right;
     }
 </style>
-""", unsafe_allow_html=True)
+""".split())
+
+# One job match card; kept on a single line so joined cards never form an indented (code) block
+JOB_CARD_TEMPLATE = (
+    '<div class="job-card{rtl}">'
+    '<h4>{job[title]}</h4>'
+    '<p><strong>{texts[company]}:</strong> {job[company]}</p>'
+    '<p><strong>{texts[location]}:</strong> {job[location]}</p>'
+    '<p><strong>{texts[salary]}:</strong> {job[salary]}</p>'
+    '<p><strong>{texts[experience]}:</strong> {job[experience]}</p>'
+    '<span class="match-badge">{texts[match_percentage]}: {job[match_percentage]}%</span>'
+    '</div>'
+)
+
+# Initialize components, each cached on its own so Streamlit tracks them independently
+@st.cache_resource(show_spinner=False)
+def get_resume_parser():
+    """Shared resume parser."""
+    return ResumeParser()
+
+@st.cache_resource(show_spinner=False)
+def get_ai_analyzer():
+    """Shared AI analyzer."""
+    return AIAnalyzer()
+
+@st.cache_resource(show_spinner=False)
+def get_job_matcher():
+    """Shared job matcher; its job features are computed once, when it is created."""
+    return JobMatcher()
 
-# Initialize components
 @st.cache_resource
-def initialize_components():
-    """Initialize all backend components."""
-    return {
-        'resume_parser': ResumeParser(),
-        'ai_analyzer': AIAnalyzer(),
-        'job_matcher': JobMatcher(),
-        'language_processor': LanguageProcessor(),
-        'pdf_generator': PDFGenerator()
-    }
+def get_language_processor():
+    """Shared language processor."""
+    return LanguageProcessor()
+
+@st.cache_resource
+def get_pdf_generator():
+    """Shared PDF report generator; reportlab is only imported once a report is requested."""
+    from pdf_generator import PDFGenerator
+    
+    return PDFGenerator()
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def parse_uploaded_resume(file_hash, file_name, _file_bytes):
+    """Parse an uploaded resume; cached by content hash, so the bytes themselves are not hashed again."""
+    return get_resume_parser().parse_resume_bytes(_file_bytes, file_name)
+
+@st.cache_resource
+def get_report_executor():
+    """Worker pool that renders PDF reports off the script thread."""
+    return ThreadPoolExecutor(max_workers=2)
+
+def build_report_pdf(pdf_generator, resume_data, analysis_results, job_matches, lang_code):
+    """Render the analysis report and return the PDF bytes (generated in memory)."""
+    return pdf_generator.generate_analysis_report_bytes(
+        resume_data=resume_data,
+        analysis_results=analysis_results,
+        job_matches=job_matches,
+        language=lang_code
+    )
 
 # Initialize session state
 if 'analysis_complete' not in st.session_state:
@@ -143,11 +193,15 @@ if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = None
 if 'job_matches' not in st.session_state:
     st.session_state.job_matches = None
+if 'pdf_future' not in st.session_state:
+    st.session_state.pdf_future = None
+    st.session_state.pdf_language = None
 
 def main():
     """Main application function."""
-    # Initialize components
-    components = initialize_components()
+    # Every rerun rebuilds the page, so the styles are sent on each run; an element left out
+    # of a rerun (such as a cached, inject-once call) is removed from the page
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     
     # Language selection
     language = st.sidebar.selectbox(
@@ -158,7 +212,7 @@ def main():
     
     # Get UI texts
     lang_code = 'ar' if language == "العربية" else 'en'
-    texts = components['language_processor'].get_ui_texts(lang_code)
+    texts = get_language_processor().get_ui_texts(lang_code)
     
     # Main header
     if lang_code == 'ar':
@@ -189,31 +243,35 @@ def main():
         if st.button(texts["analyze_button"], type="primary"):
             with st.spinner(texts["loading"]):
                 try:
-                    # Save uploaded file temporarily
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{uploaded_file.name.split(".")[-1]}') as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        tmp_file_path = tmp_file.name
-                    
-                    # Parse resume
-                    resume_data = components['resume_parser'].parse_resume(tmp_file_path)
+                    # Parse resume (repeated uploads of the same file are served from the cache)
+                    file_bytes = uploaded_file.getvalue()
+                    resume_data = parse_uploaded_resume(
+                        hashlib.sha256(file_bytes).hexdigest(),
+                        uploaded_file.name,
+                        file_bytes
+                    )
                     
                     # Detect language of resume content
-                    resume_language = components['language_processor'].detect_language(resume_data.get('raw_text', ''))
+                    resume_language = get_language_processor().detect_language(resume_data.get('raw_text', ''))
                     
-                    # Analyze resume
-                    analysis_results = components['ai_analyzer'].analyze_resume(resume_data, resume_language)
-                    
-                    # Match jobs
-                    job_matches = components['job_matcher'].match_resume_to_jobs(resume_data, top_n=5)
+                    # Analyze resume and match jobs concurrently; both only need the parsed resume,
+                    # and the analysis mostly waits on the OpenAI API
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        analysis_future = executor.submit(
+                            get_ai_analyzer().analyze_resume, resume_data, resume_language
+                        )
+                        job_matches_future = executor.submit(
+                            get_job_matcher().match_resume_to_jobs, resume_data, top_n=5
+                        )
+                        analysis_results = analysis_future.result()
+                        job_matches = job_matches_future.result()
                     
                     # Store results in session state
                     st.session_state.resume_data = resume_data
                     st.session_state.analysis_results = analysis_results
                     st.session_state.job_matches = job_matches
                     st.session_state.analysis_complete = True
-                    
-                    # Clean up temporary file
-                    os.unlink(tmp_file_path)
+                    st.session_state.pdf_future = None
                     
                     st.success("Analysis completed successfully!" if lang_code == 'en' else "تم إكمال التحليل بنجاح!")
                     
@@ -223,7 +281,7 @@ def main():
     
     # Display results if analysis is complete
     if st.session_state.analysis_complete and st.session_state.analysis_results:
-        display_results(components, texts, lang_code)
+        display_results(texts, lang_code)
     
     # Sidebar information
     with st.sidebar:
@@ -253,22 +311,28 @@ def main():
         st.markdown("- English")
         st.markdown("- العربية")
 
-def display_results(components, texts, lang_code):
+def display_results(texts, lang_code):
     """Display analysis results."""
-    resume_data = st.session_state.resume_data
     analysis_results = st.session_state.analysis_results
     job_matches = st.session_state.job_matches
     
+    # Everything the page needs from the results, looked up once
+    score = analysis_results.get('score', 0)
+    strengths = analysis_results.get('strengths', [])
+    weaknesses = analysis_results.get('weaknesses', [])
+    improved_summary = analysis_results.get('improved_summary', '')
+    suggestions = analysis_results.get('suggestions', [])
+    
+    # Extra CSS class of the result cards, and the class attribute of the headings
+    rtl = ' rtl' if lang_code == 'ar' else ''
+    rtl_class = ' class="rtl"' if lang_code == 'ar' else ''
+    
     # Overall Score Section
     st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
     
-    if lang_code == 'ar':
-        st.markdown(f'<h2 class="rtl">{texts["overall_score"]}</h2>', unsafe_allow_html=True)
-    else:
-        st.markdown(f'<h2>{texts["overall_score"]}</h2>', unsafe_allow_html=True)
+    st.markdown(f'<h2{rtl_class}>{texts["overall_score"]}</h2>', unsafe_allow_html=True)
     
-    score = analysis_results.get('score', 0)
-    score_description = components['language_processor'].format_score_description(score, lang_code)
+    score_description = get_language_processor().format_score_description(score, lang_code)
     
     # Create score visualization
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -287,69 +351,48 @@ def display_results(components, texts, lang_code):
     # Detailed Analysis Section
     st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
     
-    if lang_code == 'ar':
-        st.markdown(f'<h2 class="rtl">{texts["resume_analysis"]}</h2>', unsafe_allow_html=True)
-    else:
-        st.markdown(f'<h2>{texts["resume_analysis"]}</h2>', unsafe_allow_html=True)
+    st.markdown(f'<h2{rtl_class}>{texts["resume_analysis"]}</h2>', unsafe_allow_html=True)
     
     # Strengths
-    strengths = analysis_results.get('strengths', [])
     if strengths:
-        if lang_code == 'ar':
-            st.markdown(f'<h3 class="rtl">{texts["strengths"]}</h3>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<h3>{texts["strengths"]}</h3>', unsafe_allow_html=True)
+        st.markdown(f'<h3{rtl_class}>{texts["strengths"]}</h3>', unsafe_allow_html=True)
         
-        for strength in strengths:
-            if lang_code == 'ar':
-                st.markdown(f'<div class="strength-card rtl">✅ {strength}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="strength-card">✅ {strength}</div>', unsafe_allow_html=True)
+        # All cards of a section go out in one message
+        st.markdown(
+            '\n'.join(f'<div class="strength-card{rtl}">✅ {strength}</div>' for strength in strengths),
+            unsafe_allow_html=True
+        )
     
     # Weaknesses
-    weaknesses = analysis_results.get('weaknesses', [])
     if weaknesses:
-        if lang_code == 'ar':
-            st.markdown(f'<h3 class="rtl">{texts["weaknesses"]}</h3>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<h3>{texts["weaknesses"]}</h3>', unsafe_allow_html=True)
+        st.markdown(f'<h3{rtl_class}>{texts["weaknesses"]}</h3>', unsafe_allow_html=True)
         
-        for weakness in weaknesses:
-            if lang_code == 'ar':
-                st.markdown(f'<div class="weakness-card rtl">⚠️ {weakness}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="weakness-card">⚠️ {weakness}</div>', unsafe_allow_html=True)
+        st.markdown(
+            '\n'.join(f'<div class="weakness-card{rtl}">⚠️ {weakness}</div>' for weakness in weaknesses),
+            unsafe_allow_html=True
+        )
     
     # Improved Summary
-    improved_summary = analysis_results.get('improved_summary', '')
     if improved_summary:
-        if lang_code == 'ar':
-            st.markdown(f'<h3 class="rtl">{texts["summary"]}</h3>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<h3>{texts["summary"]}</h3>', unsafe_allow_html=True)
+        st.markdown(f'<h3{rtl_class}>{texts["summary"]}</h3>', unsafe_allow_html=True)
         
-        if lang_code == 'ar':
-            st.markdown(f'<div class="suggestion-card rtl">{improved_summary}</div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="suggestion-card">{improved_summary}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="suggestion-card{rtl}">{improved_summary}</div>', unsafe_allow_html=True)
     
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Suggestions Section
-    suggestions = analysis_results.get('suggestions', [])
     if suggestions:
         st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
         
-        if lang_code == 'ar':
-            st.markdown(f'<h2 class="rtl">{texts["suggestions"]}</h2>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<h2>{texts["suggestions"]}</h2>', unsafe_allow_html=True)
+        st.markdown(f'<h2{rtl_class}>{texts["suggestions"]}</h2>', unsafe_allow_html=True)
         
-        for i, suggestion in enumerate(suggestions, 1):
-            if lang_code == 'ar':
-                st.markdown(f'<div class="suggestion-card rtl">{i}. {suggestion}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="suggestion-card">{i}. {suggestion}</div>', unsafe_allow_html=True)
+        st.markdown(
+            '\n'.join(
+                f'<div class="suggestion-card{rtl}">{i}. {suggestion}</div>'
+                for i, suggestion in enumerate(suggestions, 1)
+            ),
+            unsafe_allow_html=True
+        )
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -357,71 +400,74 @@ def display_results(components, texts, lang_code):
     if job_matches:
         st.markdown('<div class="job-matches-section">', unsafe_allow_html=True)
         
-        if lang_code == 'ar':
-            st.markdown(f'<h2 class="rtl">{texts["job_matches"]}</h2>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<h2>{texts["job_matches"]}</h2>', unsafe_allow_html=True)
+        st.markdown(f'<h2{rtl_class}>{texts["job_matches"]}</h2>', unsafe_allow_html=True)
         
-        for job in job_matches:
-            if lang_code == 'ar':
-                st.markdown(f'''
-                <div class="job-card rtl">
-                    <h4>{job['title']}</h4>
-                    <p><strong>{texts["company"]}:</strong> {job['company']}</p>
-                    <p><strong>{texts["location"]}:</strong> {job['location']}</p>
-                    <p><strong>{texts["salary"]}:</strong> {job['salary']}</p>
-                    <p><strong>{texts["experience"]}:</strong> {job['experience']}</p>
-                    <span class="match-badge">{texts["match_percentage"]}: {job['match_percentage']}%</span>
-                </div>
-                ''', unsafe_allow_html=True)
-            else:
-                st.markdown(f'''
-                <div class="job-card">
-                    <h4>{job['title']}</h4>
-                    <p><strong>{texts["company"]}:</strong> {job['company']}</p>
-                    <p><strong>{texts["location"]}:</strong> {job['location']}</p>
-                    <p><strong>{texts["salary"]}:</strong> {job['salary']}</p>
-                    <p><strong>{texts["experience"]}:</strong> {job['experience']}</p>
-                    <span class="match-badge">{texts["match_percentage"]}: {job['match_percentage']}%</span>
-                </div>
-                ''', unsafe_allow_html=True)
+        st.markdown(
+            '\n'.join(JOB_CARD_TEMPLATE.format(job=job, texts=texts, rtl=rtl) for job in job_matches),
+            unsafe_allow_html=True
+        )
         
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Download Section
+    display_download_section(texts, lang_code)
+
+@st.fragment
+def display_download_section(texts, lang_code):
+    """Display the report download controls; requesting a report does not redraw the results."""
+    resume_data = st.session_state.resume_data
+    analysis_results = st.session_state.analysis_results
+    job_matches = st.session_state.job_matches
+    
     st.markdown('<div class="download-section">', unsafe_allow_html=True)
     
     if st.button(texts["download_report"], type="secondary"):
-        try:
-            with st.spinner("Generating PDF report..." if lang_code == 'en' else "جاري إنشاء تقرير PDF..."):
-                # Generate PDF report
-                pdf_path = components['pdf_generator'].generate_analysis_report(
-                    resume_data=resume_data,
-                    analysis_results=analysis_results,
-                    job_matches=job_matches,
-                    language=lang_code,
-                    output_path='resume_analysis_report.pdf'
-                )
-                
-                # Read PDF file
-                with open(pdf_path, 'rb') as pdf_file:
-                    pdf_bytes = pdf_file.read()
-                
+        # Render the report in the background; the results above stay usable meanwhile
+        st.session_state.pdf_future = get_report_executor().submit(
+            build_report_pdf,
+            get_pdf_generator(),
+            resume_data,
+            analysis_results,
+            job_matches,
+            lang_code
+        )
+        st.session_state.pdf_language = lang_code
+    
+    pdf_future = st.session_state.pdf_future
+    if pdf_future is not None and st.session_state.pdf_language == lang_code:
+        if not pdf_future.done():
+            st.info("Generating PDF report..." if lang_code == 'en' else "جاري إنشاء تقرير PDF...")
+            # Poll until the report is ready, rerunning only this fragment
+            time.sleep(REPORT_POLL_SECONDS)
+            st.rerun(scope="fragment")
+        else:
+            try:
                 # Create download button
                 st.download_button(
                     label="📄 Download PDF Report" if lang_code == 'en' else "📄 تحميل تقرير PDF",
-                    data=pdf_bytes,
+                    data=pdf_future.result(),
                     file_name="resume_analysis_report.pdf",
                     mime="application/pdf"
                 )
-                
-                # Clean up PDF file
-                os.unlink(pdf_path)
-                
-        except Exception as e:
-            st.error(f"Error generating PDF: {str(e)}")
+            except Exception as e:
+                st.error(f"Error generating PDF: {str(e)}")
     
     st.markdown('</div>', unsafe_allow_html=True)
 
+# Cached (failures included, since they are caught) so the warm-up runs once per process;
+# the script itself is re-executed on every rerun, so a module-level flag would not persist
+@st.cache_resource(show_spinner=False)
+def warm_up_components():
+    """Create the components needed for an analysis, so the first Analyze click does not wait for them."""
+    try:
+        # The spaCy model behind the parser's name recognition is loaded on first access
+        get_resume_parser().nlp_en
+        get_ai_analyzer()
+        get_job_matcher()
+    except Exception as e:
+        print(f"Warning: Could not warm up components: {e}")
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
+    # After the page is drawn, so loading does not delay the first paint; later reruns skip it
+    warm_up_components() 
\ No newline at end of file
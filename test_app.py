@@ -65,6 +65,18 @@ def test_job_matcher():
             industries = matcher.get_available_industries()
             print(f"✅ Available industries: {industries}")
             
+            # Test batched matching against single-resume matching
+            resumes = [
+                {'skills': ['Python', 'AWS', 'Docker'], 'raw_text': 'Software engineer with 5 years of experience'},
+                {'skills': ['SEO', 'Copywriting'], 'raw_text': 'Content writer'}
+            ]
+            batch_matches = matcher.match_resumes_batch(resumes, top_n=3)
+            single_matches = [matcher.match_resume_to_jobs(resume, top_n=3) for resume in resumes]
+            if batch_matches != single_matches:
+                print("❌ Batched job matches differ from single-resume matches")
+                return False
+            print(f"✅ Batched matching: {[len(matches) for matches in batch_matches]} matches per resume")
+            
             return True
         else:
             print("❌ Job matcher failed to load job data")
@@ -152,11 +164,53 @@ def test_ai_analyzer():
         print(f"   - Strengths: {len(analysis.get('strengths', []))}")
         print(f"   - Suggestions: {len(analysis.get('suggestions', []))}")
         
+        # Test batched keyword scoring against the single-list version
+        keyword_lists = [['Python', 'React'], ['Java', 'Spring'], []]
+        scores = analyzer.calculate_keyword_scores('Python and React developer', keyword_lists)
+        if scores != [analyzer.calculate_keyword_score('Python and React developer', k) for k in keyword_lists]:
+            print("❌ Batched keyword scores differ from single keyword scores")
+            return False
+        print(f"✅ Keyword scores: {scores}")
+        
         return True
     except Exception as e:
         print(f"❌ AI analyzer error: {e}")
         return False
 
+def test_analysis_cache():
+    """Test analysis cache functionality."""
+    try:
+        from analysis_cache import AnalysisCache
+        
+        cache = AnalysisCache(max_entries=2)
+        resume_data = {'name': 'John Doe', 'raw_text': 'Experienced software engineer skilled in Python and React'}
+        analysis = {'score': 80, 'strengths': ['Strong skills']}
+        
+        key = cache.make_key(resume_data, 'en')
+        cache.set(key, resume_data['raw_text'], 'en', analysis)
+        
+        # Exact hit
+        if cache.get(key, resume_data['raw_text'], 'en') != analysis:
+            print("❌ Exact cache lookup failed")
+            return False
+        
+        # Semantic hit on an identical text with different metadata
+        other_key = cache.make_key(dict(resume_data, name='J. Doe'), 'en')
+        if cache.get(other_key, resume_data['raw_text'], 'en') != analysis:
+            print("❌ Semantic cache lookup failed")
+            return False
+        
+        # No semantic hit across languages
+        if cache.get(cache.make_key(resume_data, 'ar'), resume_data['raw_text'], 'ar') is not None:
+            print("❌ Semantic cache matched across languages")
+            return False
+        
+        print(f"✅ Analysis cache working with {len(cache)} entries")
+        return True
+    except Exception as e:
+        print(f"❌ Analysis cache error: {e}")
+        return False
+
 def test_pdf_generator():
     """Test PDF generator functionality."""
     try:
@@ -220,6 +274,7 @@ def main():
         ("Job Matcher", test_job_matcher),
         ("Resume Parser", test_resume_parser),
         ("AI Analyzer", test_ai_analyzer),
+        ("Analysis Cache", test_analysis_cache),
         ("PDF Generator", test_pdf_generator)
     ]
     